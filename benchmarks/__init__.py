@@ -0,0 +1 @@
+"""Benchmarks for wait strategies against a local synthetic Twitch-like site"""
@@ -0,0 +1,167 @@
+"""
+Local fixture site of generated pages that mimic Twitch loading behaviour.
+
+Every page sets window.__ready = true once it is genuinely ready, so a
+benchmark can tell whether a wait strategy returned too early. Delays are
+randomized per request from the 'seed' query parameter.
+"""
+
+import base64
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+# 1x1 transparent PNG
+PIXEL = base64.b64decode(
+    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR42mNkYAAAAAYAAjCB0C8AAAAASUVORK5CYII="
+)
+
+LAYOUT = """<!DOCTYPE html>
+<html><head><meta name="viewport" content="width=device-width">
+<style>
+body {{ margin: 0; font-family: sans-serif; }}
+article {{ height: 220px; margin: 8px; background: #eee; }}
+.skeleton {{ height: 220px; margin: 8px; background: #ccc; }}
+.overlay {{ position: fixed; inset: 0; background: rgba(0,0,0,.6); }}
+img {{ width: 100%; height: 160px; }}
+</style></head>
+<body>
+<div id="root"></div>
+<script>
+window.__ready = false;
+const root = document.getElementById('root');
+function card(i) {{
+    const a = document.createElement('article');
+    a.innerHTML = `<a class="tw-link tw-card" href="/streamer${{i}}/home">Streamer ${{i}}</a>`;
+    return a;
+}}
+{script}
+</script>
+</body></html>
+"""
+
+PAGES = {
+    # Skeletons shown for a while, then swapped for cards
+    "skeleton": """
+for (let i = 0; i < 6; i++) {{
+    const s = document.createElement('div');
+    s.className = 'skeleton tw-skeleton';
+    root.appendChild(s);
+}}
+setTimeout(() => {{
+    root.innerHTML = '';
+    for (let i = 0; i < 12; i++) root.appendChild(card(i));
+    window.__ready = true;
+}}, {delay});
+""",
+    # Cards arrive in several batches; more load when scrolled to the bottom
+    "infinite_scroll": """
+let count = 0;
+function batch(n) {{ for (let i = 0; i < n; i++) root.appendChild(card(count++)); }}
+let batches = 0;
+const timer = setInterval(() => {{
+    batch(4);
+    if (++batches === 4) {{ clearInterval(timer); window.__ready = true; }}
+}}, {delay} / 4);
+window.addEventListener('scroll', () => {{
+    if (window.innerHeight + window.scrollY >= document.body.offsetHeight - 50) {{
+        setTimeout(() => batch(8), 200);
+    }}
+}});
+""",
+    # Consent banner injected late; ready once it has been accepted
+    "cookie_banner": """
+for (let i = 0; i < 8; i++) root.appendChild(card(i));
+setTimeout(() => {{
+    const banner = document.createElement('div');
+    banner.className = 'overlay';
+    banner.setAttribute('data-a-target', 'consent-banner');
+    banner.innerHTML = '<button data-a-target="consent-banner-accept">Accept</button>';
+    banner.querySelector('button').onclick = () => {{
+        banner.remove();
+        window.__ready = true;
+    }};
+    document.body.appendChild(banner);
+}}, {delay});
+""",
+    # Mature-content gate overlaying the player
+    "mature_gate": """
+root.innerHTML = '<video muted></video>';
+setTimeout(() => {{
+    const gate = document.createElement('div');
+    gate.className = 'overlay';
+    gate.innerHTML = '<button data-a-target="content-classification-gate-overlay-start-watching-button">Start Watching</button>';
+    gate.querySelector('button').onclick = () => {{
+        gate.remove();
+        window.__ready = true;
+    }};
+    document.body.appendChild(gate);
+}}, {delay});
+""",
+    # Thumbnails served slowly by the fixture server
+    "slow_images": """
+for (let i = 0; i < 8; i++) {{
+    const a = card(i);
+    const img = document.createElement('img');
+    img.src = `/img?delay=${{{delay} + i * 100}}&i=${{i}}`;
+    a.appendChild(img);
+    root.appendChild(a);
+}}
+Promise.all(Array.from(document.images).map(
+    img => new Promise(r => {{ if (img.complete) r(); else img.onload = img.onerror = r; }})
+)).then(() => {{ window.__ready = true; }});
+""",
+}
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        parts = urlsplit(self.path)
+        query = parse_qs(parts.query)
+
+        if parts.path == "/img":
+            time.sleep(int(query.get("delay", ["0"])[0]) / 1000)
+            return self._send(200, "image/png", PIXEL)
+
+        name = parts.path.strip("/")
+        if name not in PAGES:
+            return self._send(404, "text/plain", b"not found")
+
+        seed = int(query.get("seed", ["0"])[0])
+        base = self.server.base_delay_ms
+        delay = random.Random(f"{name}:{seed}").randint(base // 2, base * 2)
+        html = LAYOUT.format(script=PAGES[name].format(delay=delay))
+        self._send(200, "text/html; charset=utf-8", html.encode())
+
+    def _send(self, status, content_type, body):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class FixtureSite(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, base_delay_ms=800):
+        super().__init__(("127.0.0.1", 0), FixtureHandler)
+        self.base_delay_ms = base_delay_ms
+
+    def url(self, page, seed=0):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/{page}?seed={seed}"
+
+    def start(self):
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
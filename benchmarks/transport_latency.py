@@ -0,0 +1,80 @@
+"""
+Per-command latency of WebDriver vs the direct DevTools transport.
+
+Usage:
+    python -m benchmarks.transport_latency [-n 200]
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from benchmarks.fixture_site import FixtureSite
+from utils.cdp_transport import open_cdp_session
+from utils.driver_factory import create_driver
+
+CARD_SELECTOR = "article a[href$='/home'].tw-link"
+
+
+def measure(fn, repetitions):
+    samples = []
+    for _ in range(repetitions):
+        start_time = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start_time) * 1000)
+    samples.sort()
+    return statistics.median(samples), samples[int(0.95 * (len(samples) - 1))]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare WebDriver and CDP transports")
+    parser.add_argument("-n", "--repetitions", type=int, default=200)
+    args = parser.parse_args(argv)
+
+    site = FixtureSite(base_delay_ms=0).start()
+    driver = create_driver()
+    try:
+        driver.get(site.url("infinite_scroll"))
+        cdp = open_cdp_session(driver)
+        count_js = "return document.querySelectorAll(arguments[0]).length;"
+
+        cases = {
+            "evaluate": (
+                lambda: driver.execute_script("return 1;"),
+                lambda: cdp.execute_script("return 1;"),
+            ),
+            "dom_query": (
+                lambda: driver.execute_script(count_js, CARD_SELECTOR),
+                lambda: cdp.count(CARD_SELECTOR),
+            ),
+            "async_script": (
+                lambda: driver.execute_async_script("arguments[0](1);"),
+                lambda: cdp.execute_async_script("arguments[0](1);"),
+            ),
+            "5x_dom_query": (
+                lambda: [driver.execute_script(count_js, CARD_SELECTOR) for _ in range(5)],
+                lambda: cdp.evaluate_many([(count_js, [CARD_SELECTOR])] * 5),
+            ),
+            "screenshot": (
+                lambda: driver.get_screenshot_as_base64(),
+                lambda: cdp.capture_screenshot(),
+            ),
+        }
+
+        print(f"{'command':<14} {'webdriver p50/p95 ms':>22} {'cdp p50/p95 ms':>18} {'speedup':>8}")
+        for name, (webdriver_fn, cdp_fn) in cases.items():
+            repetitions = args.repetitions // 10 if name == "screenshot" else args.repetitions
+            wd50, wd95 = measure(webdriver_fn, repetitions)
+            cdp50, cdp95 = measure(cdp_fn, repetitions)
+            print(
+                f"{name:<14} {wd50:>10.2f} / {wd95:<9.2f} {cdp50:>7.2f} / {cdp95:<8.2f} "
+                f"{wd50 / cdp50 if cdp50 else 0:>7.1f}x"
+            )
+    finally:
+        driver.quit()
+        site.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,136 @@
+"""
+Benchmark BasePage wait strategies against the local fixture site.
+
+For every strategy it measures latency-to-ready, false-ready rate (the
+strategy returned before the page set window.__ready) and WebDriver command
+count over many repetitions, compares them with stored baselines and exits
+non-zero on regression.
+
+Usage:
+    python -m benchmarks.wait_strategies [-r 20] [--update-baseline]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from benchmarks.fixture_site import FixtureSite
+from pages.twitch_page import TwitchHomePage
+from utils.command_profiler import profiler
+from utils.config import Config
+from utils.driver_factory import create_driver
+from utils.Twitch_locators import TwitchLocators
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baselines.json")
+
+STRATEGIES = {
+    "dom_stable": ("skeleton", lambda page: page.wait_for_dom_stable()),
+    "dom_stable_scroll": ("infinite_scroll", lambda page: page.wait_for_dom_stable()),
+    "content_indicators": ("skeleton", lambda page: page.wait_for_content_indicators()),
+    "skeleton_loaders": ("skeleton", lambda page: page.wait_for_skeleton_loaders()),
+    "content_ready": ("skeleton", lambda page: page.wait_for_content_ready()),
+    "images_loaded": ("slow_images", lambda page: page.wait_for_images_loaded()),
+    "popup_handler": (
+        "cookie_banner",
+        lambda page: page.popup_handler(
+            TwitchLocators.COOKIE_BANNER, TwitchLocators.COOKIE_ACCEPT
+        ),
+    ),
+    "mature_popup": ("mature_gate", lambda page: page.handle_mature_content_popup()),
+}
+
+
+def run_strategy(driver, site, name, repetitions):
+    page_name, strategy = STRATEGIES[name]
+    latencies, commands, false_ready = [], [], 0
+
+    for seed in range(repetitions):
+        driver.get(site.url(page_name, seed))
+        page = TwitchHomePage(driver)
+
+        before = profiler.total()
+        start_time = time.perf_counter()
+        try:
+            strategy(page)
+        except Exception:
+            pass
+        latencies.append((time.perf_counter() - start_time) * 1000)
+        commands.append(profiler.total() - before)
+
+        if not driver.execute_script("return window.__ready === true"):
+            false_ready += 1
+
+    return {
+        "p50_ms": round(statistics.median(latencies), 1),
+        "p95_ms": round(sorted(latencies)[int(0.95 * (len(latencies) - 1))], 1),
+        "false_ready_rate": round(false_ready / repetitions, 3),
+        "commands": round(statistics.mean(commands), 1),
+    }
+
+
+def regressions(results, baselines, threshold):
+    """Human-readable regressions of results against baselines."""
+    found = []
+    for name, result in results.items():
+        baseline = baselines.get(name)
+        if baseline is None:
+            continue
+        for metric in ("p50_ms", "p95_ms", "commands"):
+            if result[metric] > baseline[metric] * (1 + threshold):
+                found.append(f"{name}.{metric}: {baseline[metric]} -> {result[metric]}")
+        if result["false_ready_rate"] > baseline["false_ready_rate"] + 0.05:
+            found.append(
+                f"{name}.false_ready_rate: "
+                f"{baseline['false_ready_rate']} -> {result['false_ready_rate']}"
+            )
+    return found
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark BasePage wait strategies")
+    parser.add_argument("-r", "--repetitions", type=int, default=20)
+    parser.add_argument("-s", "--strategies", nargs="+", default=list(STRATEGIES))
+    parser.add_argument("--threshold", type=float, default=0.2)
+    parser.add_argument("--base-delay-ms", type=int, default=800)
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args(argv)
+
+    # Fixed timeouts: adaptive ones would depend on the local suite history
+    # in Config.LATENCY_STATS_FILE and make baselines unreproducible
+    Config.ADAPTIVE_WAITS = False
+
+    site = FixtureSite(args.base_delay_ms).start()
+    driver = create_driver()
+    profiler.instrument(driver)
+    results = {}
+    try:
+        for name in args.strategies:
+            results[name] = run_strategy(driver, site, name, args.repetitions)
+            print(f"{name:<20} {json.dumps(results[name])}")
+    finally:
+        driver.quit()
+        site.stop()
+
+    try:
+        with open(BASELINE_PATH, encoding="utf-8") as f:
+            baselines = json.load(f)
+    except (OSError, ValueError):
+        baselines = {}
+
+    if args.update_baseline:
+        baselines.update(results)
+        with open(BASELINE_PATH, "w", encoding="utf-8") as f:
+            json.dump(baselines, f, indent=2, sort_keys=True)
+        print(f"Baselines written to {BASELINE_PATH}")
+        return 0
+
+    found = regressions(results, baselines, args.threshold)
+    for line in found:
+        print(f"REGRESSION {line}")
+    return 1 if found else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
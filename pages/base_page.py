@@ -1,20 +1,84 @@
+import json
 import logging
 import time
-from selenium.webdriver.common.by import By
+from contextlib import contextmanager
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from utils.artifacts import artifact_path
+from utils.cdp_transport import get_cdp_session
 from utils.config import Config, LocatorSelectors, Messages
-
-
+from utils.element_cache import ElementCache
+from utils.fast_mode import active_patterns
+from utils.latency_stats import get_latency_stats
+from utils.network_monitor import get_network_monitor
+from utils.overlay_watchdog import get_overlay_watchdog
+from utils.screenshot_service import get_screenshot_service
+from utils.tracing import traced_class
+from utils.web_vitals import flush_vitals
+
+
+# Script errors raised when the document navigates away mid-script
+NAVIGATION_ERRORS = (
+    "document unloaded",
+    "execution context was destroyed",
+    "cannot find context",
+    "inspected target navigated",
+    "frame detached",
+)
+
+
+def is_navigation_error(error):
+    """True if a WebDriverException was caused by the page navigating away."""
+    message = str(error).lower()
+    return any(marker in message for marker in NAVIGATION_ERRORS)
+
+
+# In-page helper resolving a Selenium (by, value) locator to a node list
+RESOLVE_LOCATOR_JS = """
+function resolveLocator(by, value) {
+    if (by === 'xpath') {
+        const nodes = [];
+        const snapshot = document.evaluate(
+            value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        for (let i = 0; i < snapshot.snapshotLength; i++) {
+            nodes.push(snapshot.snapshotItem(i));
+        }
+        return nodes;
+    }
+    const selector = {
+        'id': `[id="${value}"]`,
+        'name': `[name="${value}"]`,
+        'class name': `.${value}`,
+        'tag name': value,
+    }[by] || value;
+    return Array.from(document.querySelectorAll(selector));
+}
+"""
+
+
+@traced_class
 class BasePage:
-    def __init__(self, driver):
+    def __init__(self, driver, cache_elements=False):
         self.driver = driver
+        self.element_cache = ElementCache(driver) if cache_elements else None
         self.wait = WebDriverWait(driver, 10)
         self.logger = logging.getLogger(self.__class__.__name__)
+        self.screenshots = get_screenshot_service(driver)
+        self.network = get_network_monitor(driver)
+        self.latency = get_latency_stats()
+        self.overlay_watchdog = get_overlay_watchdog(driver)
 
     def open_url(self, url):
         start_time = time.time()
+        self.network.poll()
+        seen = set(self.network.requests)
+        if self.element_cache:
+            self.element_cache.invalidate()
+        # Vitals and overlay dismissals of the document being left are lost on navigation
+        flush_vitals(self.driver)
+        if self.overlay_watchdog:
+            self.overlay_watchdog.log_dismissals()
 
         self.driver.get(url)
         self.logger.info(f"Opened URL: {url}")
@@ -23,20 +87,183 @@ class BasePage:
 
         elapsed = time.time() - start_time
         self.logger.info(f"✓ Page fully loaded in {elapsed:.2f}s")
-        self.driver.save_screenshot(Config.SCREENSHOT_HOME)
+        self.record_navigation(url, elapsed, seen)
+        self.take_screenshot(Config.SCREENSHOT_HOME)
+
+    def record_navigation(self, url, elapsed, seen_requests):
+        """Log and append bytes transferred / load time for one navigation."""
+        self.network.poll()
+        new_requests = set(self.network.requests) - seen_requests
+        stats = self.network.summary(new_requests)
+        stats.update(
+            url=url,
+            load_s=round(elapsed, 3),
+            fast_mode=bool(active_patterns(self.driver)),
+        )
+        self.logger.info(
+            f"Navigation stats: {stats['bytes'] / 1024:.0f} KB in {stats['requests']} "
+            f"requests, {stats['blocked']} blocked (fast mode: {stats['fast_mode']})"
+        )
+        with open(artifact_path("navigations.jsonl"), "a", encoding="utf-8") as f:
+            f.write(json.dumps(stats) + "\n")
+        return stats
+
+    def run_script(self, script, *args):
+        """
+        execute_script over the direct DevTools transport when the session uses it
+        (JSON-serializable arguments only), otherwise over WebDriver.
+        """
+        cdp = get_cdp_session(self.driver)
+        if cdp is not None:
+            return cdp.execute_script(script, *args)
+        return self.driver.execute_script(script, *args)
+
+    def run_async_script(self, script, *args, timeout=30):
+        """execute_async_script counterpart of run_script."""
+        cdp = get_cdp_session(self.driver)
+        if cdp is not None:
+            return cdp.execute_async_script(script, *args, timeout=timeout)
+        self.driver.set_script_timeout(timeout)
+        return self.driver.execute_async_script(script, *args)
+
+    def take_screenshot(self, name, clip=None):
+        """Queue a screenshot into the artifact store under step 'name' of the current test."""
+        return self.screenshots.capture(name, clip)
+
+    @contextmanager
+    def screenshot_step(self, name, on_failure_only=None):
+        """
+        Capture 'name' after the wrapped step. With on_failure_only, capture
+        only when the step raises.
+        """
+        if on_failure_only is None:
+            on_failure_only = Config.SCREENSHOT_ON_FAILURE_ONLY
+        try:
+            yield
+        except Exception:
+            self.take_screenshot(f"{Config.SCREENSHOT_FAILURE_PREFIX}{name}")
+            raise
+        if not on_failure_only:
+            self.take_screenshot(name)
 
     def find(self, locator):
-        return self.wait.until(EC.visibility_of_element_located(locator))
+        if self.element_cache:
+            return self.element_cache.get(locator, self._wait_visible)
+        return self._wait_visible(locator)
+
+    def _wait_visible(self, locator):
+        return self.wait_until(locator, EC.visibility_of_element_located)
+
+    def wait_until(self, locator, condition, timeout=10):
+        """
+        Wait for condition(locator) with a timeout and poll interval derived from
+        this page/locator's recorded latency history (see utils.latency_stats).
+        Elements that are usually present still get the full 'timeout'.
+        """
+        if not Config.ADAPTIVE_WAITS or not isinstance(locator, tuple):
+            return WebDriverWait(self.driver, timeout).until(condition(locator))
+
+        key = f"{self.__class__.__name__}:{locator[1]}"
+        adaptive_timeout = self.latency.timeout_for(key, timeout)
+        poll = self.latency.poll_for(key)
+        start_time = time.time()
+        try:
+            result = WebDriverWait(
+                self.driver, adaptive_timeout, poll_frequency=poll
+            ).until(condition(locator))
+        except TimeoutException:
+            usually_present = (self.latency.found_ratio(key) or 0) >= 0.5
+            remaining = timeout - (time.time() - start_time)
+            if not usually_present or remaining <= 0:
+                self.latency.record(key, time.time() - start_time, found=False)
+                raise
+            try:
+                result = WebDriverWait(
+                    self.driver, remaining, poll_frequency=poll
+                ).until(condition(locator))
+            except TimeoutException:
+                self.latency.record(key, time.time() - start_time, found=False)
+                raise
+
+        self.latency.record(key, time.time() - start_time, found=True)
+        return result
 
     def click(self, locator):
+        cdp = get_cdp_session(self.driver)
+        if cdp is not None and isinstance(locator, tuple):
+            return self._cdp_click(cdp, locator)
 
         try:
-            self.wait.until(EC.element_to_be_clickable(locator)).click()
+            self.wait_until(locator, EC.element_to_be_clickable).click()
             self.logger.info("Clicked element: %s", locator)
         except TimeoutException:
             self.logger.info("Element not clickable: %s", locator)
 
+    def _cdp_click(self, cdp, locator, timeout=10):
+        """
+        Click over the DevTools transport: wait in-page until the element is
+        visible, enabled and not covered, then dispatch a trusted tap at its center.
+        """
+        point = cdp.execute_async_script(
+            RESOLVE_LOCATOR_JS
+            + """
+        const [by, value, timeoutMs] = arguments;
+        const done = arguments[arguments.length - 1];
+        const start = performance.now();
+        let scrolled = false;
+
+        function frame() {
+            const el = resolveLocator(by, value)[0];
+            if (el && !el.disabled) {
+                if (!scrolled) {
+                    el.scrollIntoView({block: 'center', inline: 'center'});
+                    scrolled = true;
+                }
+                const rect = el.getBoundingClientRect();
+                const x = rect.left + rect.width / 2;
+                const y = rect.top + rect.height / 2;
+                const hit = rect.width > 0 && rect.height > 0 && document.elementFromPoint(x, y);
+                if (hit && (hit === el || el.contains(hit))) {
+                    return done({x: x, y: y});
+                }
+            }
+            if (performance.now() - start >= timeoutMs) {
+                return done(null);
+            }
+            requestAnimationFrame(frame);
+        }
+        frame();
+        """,
+            *locator,
+            timeout * 1000,
+            timeout=timeout + 1,
+        )
+        if point is None:
+            self.logger.info("Element not clickable: %s", locator)
+            return
+        cdp.dispatch_click(point["x"], point["y"])
+        self.logger.info("Clicked element: %s", locator)
+
     def enter_text(self, locator, text):
+        cdp = get_cdp_session(self.driver)
+        if cdp is not None and isinstance(locator, tuple):
+            # Select the current value so Input.insertText replaces it
+            focused = cdp.execute_script(
+                RESOLVE_LOCATOR_JS
+                + """
+            const el = resolveLocator(arguments[0], arguments[1])[0];
+            if (!el) return false;
+            el.focus();
+            if (el.select) el.select();
+            return document.activeElement === el;
+            """,
+                *locator,
+            )
+            if focused:
+                cdp.insert_text(text)
+                self.logger.info(f"Entering text '{text}' into element: {locator}")
+                return
+
         element = self.find(locator)
         element.clear()
         try:
@@ -49,43 +276,133 @@ class BasePage:
 
     def swipe_down(self, times=2, step=80, steps_per_swipe=10, delay=0.05):
         """
-        Smoothly scrolls down the page.
+        Smoothly scrolls down the page in one in-page animation.
+        'delay' is kept for compatibility; frames are paced by requestAnimationFrame.
         """
 
-        for _ in range(times):
-            for _ in range(steps_per_swipe):
-                self.driver.execute_script(f"window.scrollBy(0, {step});")
-                time.sleep(delay)
+        result = self.scroll_until_new_content(
+            None, max_distance=times * steps_per_swipe * step, step=step, settle=0
+        )
+        self.logger.info(f"Completed smooth swipe down ({result['distance']}px)")
+        return result
 
-        self.logger.info("Completed one smooth swipe down")
-        time.sleep(0.3)  # settle time
+    def scroll_until_new_content(
+        self, locator, max_distance=2000, step=80, timeout=10, settle=0.5
+    ):
+        """
+        Scroll with requestAnimationFrame until the number of elements matching
+        'locator' grows, 'max_distance' pixels were scrolled (plus 'settle'
+        seconds for late content) or 'timeout' expires. One async script call.
+        Returns before/after counts, scrolled distance and elapsed seconds.
+        """
+
+        script = (
+            RESOLVE_LOCATOR_JS
+            + """
+        const [by, value, maxDistance, step, timeoutMs, settleMs] = arguments;
+        const done = arguments[arguments.length - 1];
+        const count = () => by === null ? 0 : resolveLocator(by, value).length;
+
+        const before = count();
+        const start = performance.now();
+        let distance = 0;
+        let reachedAt = null;
+
+        function finish(after) {
+            done({
+                before: before,
+                after: after,
+                grew: after > before,
+                distance: distance,
+                elapsed: (performance.now() - start) / 1000,
+            });
+        }
+
+        function frame() {
+            const now = performance.now();
+            const current = count();
+            if (current > before || now - start >= timeoutMs) {
+                return finish(current);
+            }
+            if (distance < maxDistance) {
+                const y = window.scrollY;
+                window.scrollBy(0, Math.min(step, maxDistance - distance));
+                const moved = window.scrollY - y;
+                distance += moved > 0 ? moved : 0;
+                if (moved <= 0) {
+                    if (by === null) {
+                        return finish(current);  // plain swipe: nothing to wait for
+                    }
+                    if (reachedAt === null) {
+                        reachedAt = now;  // end of page: wait for more content
+                    }
+                }
+            } else if (reachedAt === null) {
+                reachedAt = now;
+            }
+            // End of page or max distance reached: give late content 'settle' to arrive
+            if (reachedAt !== null && now - reachedAt >= settleMs) {
+                return finish(current);
+            }
+            requestAnimationFrame(frame);
+        }
+        requestAnimationFrame(frame);
+        """
+        )
+
+        by, value = locator if locator else (None, None)
+        result = self.run_async_script(
+            script,
+            by,
+            value,
+            max_distance,
+            step,
+            timeout * 1000,
+            settle * 1000,
+            timeout=timeout + 1,
+        )
+
+        self.logger.info(
+            f"Scrolled {result['distance']}px in {result['elapsed']:.2f}s: "
+            f"{result['before']} -> {result['after']} elements"
+        )
+        return result
 
     def popup_handler(self, popup_locator, accept_locator):
         """
         Generic popup handler.
         Checks for popup presence and clicks accept if found.
+        Returns immediately when the overlay watchdog is active and no popup is shown.
+        Returns True only once the popup was dismissed, here or by the watchdog.
         """
-        try:
-
-            popup_accept = self.wait.until(EC.element_to_be_clickable(accept_locator))
-            if popup_accept.is_displayed():
-                self.logger.info("Popup detected, attempting to accept.")
-
-                self.click(accept_locator)
+        if self.overlay_watchdog and not self.overlay_watchdog.is_present(popup_locator):
+            entries = self.overlay_watchdog.log_dismissals()
+            if self.overlay_watchdog.dismissed(popup_locator, entries):
+                return True
+            self.logger.info("No popup detected.")
+            return False
 
-            try:
-                self.wait.until(EC.invisibility_of_element(popup_locator))
-                self.logger.info("✓ Popup confirmed dismissed.")
-            except TimeoutException:
-                self.logger.error("✗ Popup still visible after click!")
-                self.driver.save_screenshot("popup_stuck.png")
+        try:
+            popup_accept = self.wait_until(accept_locator, EC.element_to_be_clickable)
+        except TimeoutException:
+            self.logger.info("No popup detected.")
+            return False
 
-            else:
-                self.logger.info("Popup not displayed.")
-                return False
+        if not popup_accept.is_displayed():
+            self.logger.info("Popup not displayed.")
+            return False
 
+        self.logger.info("Popup detected, attempting to accept.")
+        self.click(accept_locator)
+        try:
+            self.wait.until(EC.invisibility_of_element(popup_locator))
         except TimeoutException:
-            self.logger.info("No popup detected.")
+            self.logger.error("✗ Popup still visible after click!")
+            self.take_screenshot(Config.SCREENSHOT_POPUP_STUCK)
+            return False
+
+        self.logger.info("✓ Popup confirmed dismissed.")
+        return True
 
     def wait_for_page_to_load(self):
         """
@@ -107,56 +424,206 @@ class BasePage:
             element,
         )
 
-    def wait_for_network_idle(self, timeout=5):
+    def query_elements(
+        self, locator, visible=True, enabled=False, in_viewport=False, min_ratio=None
+    ):
+        """
+        Find elements matching the locator and all requested predicates
+        in a single execute_script round trip.
+        min_ratio: minimum fraction of the element's area intersecting the viewport.
+        """
+        by, value = locator
+        result = self.driver.execute_script(
+            RESOLVE_LOCATOR_JS
+            + """
+        const [by, value, opts] = arguments;
+        const nodes = resolveLocator(by, value);
+
+        const vw = window.innerWidth || document.documentElement.clientWidth;
+        const vh = window.innerHeight || document.documentElement.clientHeight;
+
+        const matches = nodes.filter(el => {
+            const rect = el.getBoundingClientRect();
+            if (opts.visible) {
+                const style = window.getComputedStyle(el);
+                if (style.display === 'none' || style.visibility === 'hidden' ||
+                    style.opacity === '0' || rect.width === 0 || rect.height === 0) {
+                    return false;
+                }
+            }
+            if (opts.enabled && el.disabled) {
+                return false;
+            }
+            if (opts.inViewport && !(rect.top >= 0 && rect.bottom <= vh &&
+                                     rect.left >= 0 && rect.right <= vw)) {
+                return false;
+            }
+            if (opts.minRatio !== null) {
+                const area = rect.width * rect.height;
+                const w = Math.max(0, Math.min(rect.right, vw) - Math.max(rect.left, 0));
+                const h = Math.max(0, Math.min(rect.bottom, vh) - Math.max(rect.top, 0));
+                if (area === 0 || (w * h) / area < opts.minRatio) {
+                    return false;
+                }
+            }
+            return true;
+        });
+        return {matches: matches, total: nodes.length};
+        """,
+            by,
+            value,
+            {
+                "visible": visible,
+                "enabled": enabled,
+                "inViewport": in_viewport,
+                "minRatio": min_ratio,
+            },
+        )
+
+        self.logger.debug(
+            f"Query {locator}: {len(result['matches'])}/{result['total']} matched"
+        )
+        return result["matches"]
 
-        try:
-            WebDriverWait(self.driver, timeout).until(
-                lambda driver: driver.execute_script(
-                    """
-                return (typeof jQuery !== 'undefined') 
-                    ? jQuery.active == 0 
-                    : true;
-                """
-                )
-            )
+    def wait_for_network_idle(self, timeout=5, max_inflight=0, idle_time=0.5):
+        """
+        Wait until at most 'max_inflight' requests are pending for 'idle_time' seconds.
+        Tracks DevTools Network events per frame; patterns in
+        Config.NETWORK_IDLE_IGNORE (websockets, HLS, beacons) are not counted.
+        The request log stays available on self.network.
+        """
+
+        if self.network.wait_for_idle(timeout, max_inflight, idle_time):
             self.logger.info("✓ Network idle (no pending requests)")
-            # Small buffer for rendering
-        except TimeoutException:
-            self.logger.warning("Network idle timeout - proceeding anyway")
+            return True
+
+        pending = [r["url"] for r in self.network.in_flight.values()]
+        self.logger.warning(
+            f"Network idle timeout - proceeding anyway ({len(pending)} pending: {pending[:5]})"
+        )
+        return False
 
     def wait_for_document_ready(self, timeout=5):
 
         try:
             WebDriverWait(self.driver, timeout).until(
-                lambda driver: driver.execute_script("return document.readyState")
+                lambda driver: self.run_script("return document.readyState")
                 == "complete"
             )
             self.logger.info("✓ Document ready state: complete")
         except TimeoutException:
             self.logger.warning("Document ready state timeout")
 
+    def wait_for_selectors(self, selectors, mode="any", state="present", timeout=10):
+        """
+        Race all CSS selectors in one in-page observer instead of waiting on them one by one.
+        mode: "any" resolves on the first satisfied selector, "all" when every one is.
+        state: "present" (element in DOM) or "hidden" (no visible element matches).
+        Returns a dict with 'ok', 'matched' selectors and 'elapsed' seconds.
+        """
+        result = self.wait_for_conditions(
+            [{"selectors": list(selectors), "mode": mode, "state": state}], timeout
+        )
+        return dict(result, matched=result["matched"][0])
+
+    def wait_for_conditions(self, conditions, timeout=10):
+        """
+        Wait in one in-page observer until every condition holds; each is a dict
+        with 'selectors', 'mode' and 'state' as in wait_for_selectors.
+        Returns a dict with 'ok', 'matched' selectors per condition and 'elapsed'.
+        """
+
+        script = """
+        const [conditions, timeoutMs] = arguments;
+        const done = arguments[arguments.length - 1];
+        const start = performance.now();
+        let observer = null;
+        let timer = null;
+        let pending = false;
+        let finished = false;
+
+        function isVisible(el) {
+            const rect = el.getBoundingClientRect();
+            const style = window.getComputedStyle(el);
+            return rect.width > 0 && rect.height > 0 &&
+                style.display !== 'none' && style.visibility !== 'hidden';
+        }
+
+        function satisfied(selector, state) {
+            if (state === 'present') {
+                return document.querySelector(selector) !== null;
+            }
+            return !Array.from(document.querySelectorAll(selector)).some(isVisible);
+        }
+
+        function matchedBy(condition) {
+            return condition.selectors.filter(s => satisfied(s, condition.state));
+        }
+
+        function holds(condition, matched) {
+            return condition.mode === 'any'
+                ? matched.length > 0
+                : matched.length === condition.selectors.length;
+        }
+
+        function finish(ok, matched) {
+            if (finished) return;
+            finished = true;
+            if (observer) observer.disconnect();
+            clearTimeout(timer);
+            done({ok: ok, matched: matched, elapsed: (performance.now() - start) / 1000});
+        }
+
+        function check() {
+            pending = false;
+            const matched = conditions.map(matchedBy);
+            const ok = conditions.every((c, i) => holds(c, matched[i]));
+            if (ok) finish(true, matched);
+            return ok;
+        }
+
+        if (!check()) {
+            observer = new MutationObserver(() => {
+                if (!pending) {
+                    pending = true;
+                    setTimeout(check, 50);
+                }
+            });
+            observer.observe(document.documentElement, {
+                childList: true, subtree: true, attributes: true,
+            });
+            timer = setTimeout(() => finish(false, conditions.map(matchedBy)), timeoutMs);
+        }
+    """
+
+        try:
+            return self.run_async_script(
+                script, conditions, timeout * 1000, timeout=timeout + 1
+            )
+        except WebDriverException as e:
+            if not is_navigation_error(e):
+                raise
+            self.logger.debug(f"Selector wait interrupted by navigation: {e}")
+            return {"ok": False, "matched": [[] for _ in conditions], "elapsed": timeout}
+
     def wait_for_content_indicators(self, timeout=10):
         """
         Strategy 1: Wait for actual content to appear.
         More reliable than waiting for skeletons to disappear.
         """
 
-        content_found = False
-        for selector in LocatorSelectors.CONTENT_INDICATORS:
-            try:
-                WebDriverWait(self.driver, timeout).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                )
-                self.logger.info(f"✓ Content loaded: {selector}")
-                content_found = True
-                break
-            except TimeoutException:
-                continue
+        result = self.wait_for_selectors(
+            LocatorSelectors.CONTENT_INDICATORS, mode="any", timeout=timeout
+        )
 
-        if not content_found:
+        if result["ok"]:
+            self.logger.info(
+                f"✓ Content loaded: {result['matched'][0]} ({result['elapsed']:.2f}s)"
+            )
+        else:
             self.logger.warning("No content indicators found, continuing anyway")
 
-        return content_found
+        return result["ok"]
 
     def wait_for_skeleton_loaders(self, timeout=2):
         """
@@ -164,67 +631,202 @@ class BasePage:
         Uses short timeout since skeletons might not exist on all pages.
         """
 
-        for selector in LocatorSelectors.SKELETON_SELECTORS:
-            try:
-                WebDriverWait(self.driver, timeout).until(
-                    EC.invisibility_of_element_located((By.CSS_SELECTOR, selector))
-                )
-                self.logger.info(f"✓ Skeleton disappeared: {selector}")
-            except TimeoutException:
-                # Skeletons might not exist - that's OK
-                continue
+        result = self.wait_for_selectors(
+            LocatorSelectors.SKELETON_SELECTORS,
+            mode="all",
+            state="hidden",
+            timeout=timeout,
+        )
 
-    def wait_for_images_loaded(self, timeout=10):
+        if result["ok"]:
+            self.logger.info(f"✓ Skeletons disappeared ({result['elapsed']:.2f}s)")
+        else:
+            # Skeletons might still be animating - that's OK
+            pending = set(LocatorSelectors.SKELETON_SELECTORS) - set(result["matched"])
+            self.logger.info(f"Skeletons still visible: {sorted(pending)}")
+
+        return result["ok"]
+
+    def wait_for_content_ready(self, timeout=10):
         """
-        Explicitly wait until all images are loaded.
+        Strategies 1 and 2 in one bounded wait: any content indicator present
+        and every skeleton loader hidden.
         """
 
-        images_loaded = self.driver.execute_script(
-            """
-            return Array.from(document.images)
-                .filter(img => img.offsetParent !== null)
-                .every(img => img.complete && img.naturalWidth > 0);
+        result = self.wait_for_conditions(
+            [
+                {
+                    "selectors": LocatorSelectors.CONTENT_INDICATORS,
+                    "mode": "any",
+                    "state": "present",
+                },
+                {
+                    "selectors": LocatorSelectors.SKELETON_SELECTORS,
+                    "mode": "all",
+                    "state": "hidden",
+                },
+            ],
+            timeout,
+        )
+
+        content, hidden = result["matched"]
+        if result["ok"]:
+            self.logger.info(f"✓ Content ready: {content[0]} ({result['elapsed']:.2f}s)")
+        else:
+            pending = set(LocatorSelectors.SKELETON_SELECTORS) - set(hidden)
+            self.logger.warning(
+                f"Content not ready after {result['elapsed']:.2f}s "
+                f"(content: {content or 'none'}, skeletons visible: {sorted(pending)})"
+            )
+
+        return result["ok"]
+
+    def wait_for_images_loaded(
+        self, timeout=10, container=None, viewport_only=True, details=False
+    ):
+        """
+        Wait until the images the user actually sees are loaded and decoded.
+        Scoped to the viewport (and to 'container' locator if given); resolves
+        in-page from load/error events and img.decode() in one async script.
+        Returns True/False, or with 'details' a dict with 'ok', per-image
+        'images' timings/failures, 'pending' and 'elapsed'.
+        """
+
+        script = (
+            RESOLVE_LOCATOR_JS
+            + """
+        const [by, value, viewportOnly, timeoutMs] = arguments;
+        const done = arguments[arguments.length - 1];
+        const start = performance.now();
+
+        const root = by === null ? document : resolveLocator(by, value)[0];
+        if (!root) {
+            return done({ok: false, images: [], pending: 0, elapsed: 0, error: 'container not found'});
+        }
+
+        const vw = window.innerWidth || document.documentElement.clientWidth;
+        const vh = window.innerHeight || document.documentElement.clientHeight;
+        const images = Array.from(root.querySelectorAll('img')).filter(img => {
+            const rect = img.getBoundingClientRect();
+            if (rect.width === 0 || rect.height === 0) return false;
+            return !viewportOnly ||
+                (rect.bottom > 0 && rect.right > 0 && rect.top < vh && rect.left < vw);
+        });
+
+        const results = images.map(img => ({src: img.currentSrc || img.src, ok: null, ms: null}));
+        const ready = images.map((img, i) => {
+            // complete images have settled: load/error already fired (no src also counts)
+            const loaded = img.complete
+                ? (img.naturalWidth > 0 ? Promise.resolve() : Promise.reject(new Error('broken image')))
+                : new Promise((resolve, reject) => {
+                    img.addEventListener('load', resolve, {once: true});
+                    img.addEventListener('error', () => reject(new Error('load error')), {once: true});
+                });
+            return loaded
+                .then(() => img.decode ? img.decode() : null)
+                .then(() => { results[i].ok = true; })
+                .catch(e => { results[i].ok = false; results[i].error = String(e.message || e); })
+                .finally(() => { results[i].ms = performance.now() - start; });
+        });
+
+        const timer = setTimeout(() => finish(false), timeoutMs);
+        Promise.all(ready).then(() => finish(true));
+
+        function finish(settled) {
+            clearTimeout(timer);
+            done({
+                ok: settled && results.every(r => r.ok),
+                images: results,
+                pending: results.filter(r => r.ok === null).length,
+                elapsed: (performance.now() - start) / 1000,
+            });
+        }
         """
         )
 
+        by, value = container if container else (None, None)
         try:
-            WebDriverWait(self.driver, timeout, poll_frequency=1).until(images_loaded)
-            self.logger.info("✓ All images fully loaded")
-            return True
-
-        except Exception:
-            self.logger.warning("Timeout waiting for images")
-            time.sleep(0.5)  # brief wait before proceeding
-            return False
+            result = self.run_async_script(
+                script, by, value, viewport_only, timeout * 1000, timeout=timeout + 1
+            )
+        except WebDriverException as e:
+            if not is_navigation_error(e):
+                raise
+            self.logger.debug(f"Image wait interrupted by navigation: {e}")
+            result = {"ok": False, "images": [], "pending": 0, "elapsed": timeout}
+
+        failed = [i for i in result["images"] if i["ok"] is False]
+        if result["ok"]:
+            self.logger.info(
+                f"✓ {len(result['images'])} visible images loaded in {result['elapsed']:.2f}s"
+            )
+        else:
+            self.logger.warning(
+                f"Images not ready after {result['elapsed']:.2f}s: "
+                f"{result['pending']} pending, {len(failed)} failed"
+            )
+        return result if details else result["ok"]
 
     def wait_for_dom_stable(self, timeout=15, stable_time=2):
         """
         Wait until DOM stops changing for 'stable_time' seconds.
+        A MutationObserver is installed once per document and the quiet period
+        is resolved in-page through a single async script call.
         """
 
         script = """
-        if (!window.__lastDOMSize) {
-            window.__lastDOMSize = document.body.innerHTML.length;
-            window.__stableCounter = 0;
-            return false;
+        const quietMs = arguments[0];
+        const timeoutMs = arguments[1];
+        const done = arguments[arguments.length - 1];
+
+        if (!window.__domObserver) {
+            window.__lastMutation = performance.now();
+            window.__domObserver = new MutationObserver(() => {
+                window.__lastMutation = performance.now();
+            });
+            window.__domObserver.observe(document.documentElement, {
+                childList: true,
+                subtree: true,
+                attributes: true,
+                characterData: true,
+            });
         }
 
-        let currentSize = document.body.innerHTML.length;
-
-        if (currentSize === window.__lastDOMSize) {
-            window.__stableCounter++;
-        } else {
-            window.__stableCounter = 0;
-        }
+        const start = performance.now();
+        (function check() {
+            const now = performance.now();
+            const quiet = now - window.__lastMutation;
+            const elapsed = now - start;
+            if (quiet >= quietMs) {
+                return done(true);
+            }
+            if (elapsed >= timeoutMs) {
+                return done(false);
+            }
+            setTimeout(check, Math.min(quietMs - quiet, timeoutMs - elapsed));
+        })();
+    """
 
-        window.__lastDOMSize = currentSize;
+        deadline = time.time() + timeout
+        while True:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                raise TimeoutException(Messages.DOM_NOT_STABLE.format(timeout))
 
-        return window.__stableCounter >= arguments[0];
-    """
+            try:
+                stable = self.run_async_script(
+                    script, stable_time * 1000, remaining * 1000, timeout=remaining + 1
+                )
+            except WebDriverException as e:
+                if not is_navigation_error(e):
+                    raise
+                # Document navigated away mid-wait; observer is re-armed on retry
+                self.logger.debug(f"DOM observer interrupted, re-arming: {e}")
+                continue
 
-        WebDriverWait(self.driver, timeout, poll_frequency=0.5).until(
-            lambda d: d.execute_script(script, stable_time)
-        )
+            if not stable:
+                raise TimeoutException(Messages.DOM_NOT_STABLE.format(timeout))
+            break
 
         self.logger.info(Messages.STABLE_DOM)
 
@@ -243,7 +845,7 @@ class BasePage:
     def assert_element_visible(self, locator, message=None):
         """Assert element is visible on page"""
         try:
-            element = self.wait.until(EC.visibility_of_element_located(locator))
+            element = self.find(locator)
             if message is None:
                 message = f"Element should be visible: {locator}"
             assert element.is_displayed(), message
@@ -255,7 +857,7 @@ class BasePage:
     def assert_element_clickable(self, locator, message=None):
         """Assert element is clickable (visible and enabled)"""
         try:
-            element = self.wait.until(EC.element_to_be_clickable(locator))
+            element = self.wait_until(locator, EC.element_to_be_clickable)
             if message is None:
                 message = f"Element should be clickable: {locator}"
             assert element.is_enabled(), message
@@ -1,4 +1,5 @@
 import time
+from collections import OrderedDict
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from pages.base_page import BasePage
@@ -9,9 +10,12 @@ from selenium.common.exceptions import (
 )
 from selenium.webdriver.support import expected_conditions as EC
 from utils.config import Config, Messages
+from utils.state_snapshot import capture_snapshot, load_snapshot, restore_snapshot
 from utils.Twitch_locators import TwitchLocators
+from utils.tracing import traced_class
 
 
+@traced_class
 class TwitchHomePage(BasePage):
     # --- Locators ---
     SEARCH_ICON = TwitchLocators.SEARCH_ICON
@@ -22,13 +26,40 @@ class TwitchHomePage(BasePage):
     COOKIE_BANNER = TwitchLocators.COOKIE_BANNER
     COOKIE_ACCEPT = TwitchLocators.COOKIE_ACCEPT
     MATURE_WARNING = TwitchLocators.MATURE_WARNING
+    VIDEO_PLAYER = TwitchLocators.VIDEO_PLAYER
 
-    def navigate_to_twitch(self):
+    def __init__(self, driver, cache_elements=False):
+        super().__init__(driver, cache_elements)
+        self.snapshot_restored = False
+        self.crawled_count = 0
+        self._seen = OrderedDict()
+        self._crawler = None
 
-        self.open_url(Config.TWITCH_URL)
+    def navigate_to_twitch(self, url=None):
+        """
+        Open Twitch (or a deep link such as Config.STARCRAFT_DIRECTORY_URL),
+        starting from a stored consent snapshot when one is valid.
+        """
+        if Config.STATE_SNAPSHOT:
+            self.restore_state()
+        self.open_url(url or Config.TWITCH_URL)
+
+    def restore_state(self):
+        """Inject the stored browser state snapshot; returns True if applied."""
+        snapshot = load_snapshot()
+        if snapshot is not None:
+            restore_snapshot(self.driver, snapshot)
+            self.snapshot_restored = True
+        return self.snapshot_restored
 
     def handle_popup(self):
-        self.popup_handler(self.COOKIE_BANNER, self.COOKIE_ACCEPT)
+        """
+        Accept the consent banner and, once consent was actually given,
+        snapshot the resulting state for later sessions.
+        """
+        accepted = self.popup_handler(self.COOKIE_BANNER, self.COOKIE_ACCEPT)
+        if accepted and Config.STATE_SNAPSHOT and not self.snapshot_restored:
+            capture_snapshot(self.driver)
 
     def perform_click(self, locator):
         self.click(locator)
@@ -37,27 +68,258 @@ class TwitchHomePage(BasePage):
         self.enter_text(locator, text)
 
     def scroll_page(self, times=2):
-        return self.swipe_down(times)
+        """
+        Advance the directory crawler 'times' batches; it scrolls until new
+        streamer cards load. Returns the new cards.
+        """
+        cards = []
+        for _ in range(times):
+            cards.extend(self.next_streamer_batch())
+        return cards
+
+    def crawl_streamers(self, target=None, time_budget=None):
+        """
+        Scroll the directory and yield batches of cards not seen before:
+        dicts with href, title, viewers and thumbnail, extracted in bulk in-page.
+        Stops at 'target' cards, after 'time_budget' seconds or at the end of the list.
+        """
+        start_time = time.time()
+        idle_scrolls = 0
+
+        while True:
+            batch = self.collect_streamers()
+            if batch:
+                idle_scrolls = 0
+                yield batch
+                if target is not None and self.crawled_count >= target:
+                    return
+                continue
+
+            remaining = None
+            if time_budget is not None:
+                remaining = time_budget - (time.time() - start_time)
+                if remaining <= 0:
+                    self.logger.info(f"Crawler time budget reached: {self.crawled_count} cards")
+                    return
+
+            result = self.scroll_until_new_content(
+                self.RANDOM_STREAMER_CARD, timeout=min(remaining or 10, 10)
+            )
+            if not result["grew"]:
+                idle_scrolls += 1
+                if idle_scrolls >= Config.CRAWLER_MAX_IDLE_SCROLLS:
+                    self.logger.info(f"End of list reached: {self.crawled_count} cards")
+                    return
+
+    def collect_streamers(self):
+        """Record cards already in the DOM that were not seen before, without scrolling."""
+        batch = [
+            card for card in self._extract_new_cards() if card["href"] not in self._seen
+        ]
+        for card in batch:
+            self._seen[card["href"]] = True
+            if len(self._seen) > Config.CRAWLER_MAX_SEEN:
+                self._seen.popitem(last=False)
+        self.crawled_count += len(batch)
+        return batch
+
+    def reset_crawl(self):
+        """Forget recorded cards and start a new crawl of the current document."""
+        self._crawler = self.crawl_streamers()
+        self._seen = OrderedDict()
+        self.crawled_count = 0
+        self.run_script(
+            "document.querySelectorAll('[data-crawled]')"
+            ".forEach(el => el.removeAttribute('data-crawled'));"
+        )
+
+    def _extract_new_cards(self):
+        """Cards not extracted yet from this document, marked in-page as crawled."""
+        return self.run_script(
+            """
+        const cards = document.querySelectorAll(arguments[0] + ':not([data-crawled])');
+        return Array.from(cards).map(a => {
+            a.setAttribute('data-crawled', '1');
+            const article = a.closest('article') || a;
+            const title = article.querySelector('h3, h4, [title]');
+            const img = article.querySelector('img');
+            const viewers = (article.textContent || '').match(/([\\d.,]+\\s*[KkMm]?)\\s*viewers?/);
+            return {
+                href: a.href,
+                title: title ? (title.getAttribute('title') || title.textContent).trim() : '',
+                viewers: viewers ? viewers[1].trim() : null,
+                thumbnail: img ? (img.currentSrc || img.src) : null,
+            };
+        });
+        """,
+            self.RANDOM_STREAMER_CARD[1],
+        )
+
+    def next_streamer_batch(self):
+        """Next batch from this page's crawler, or [] once it has finished."""
+        if self._crawler is None:
+            self.reset_crawl()
+        return next(self._crawler, [])
 
     def select_random_streamer(self):
         """Returns True if streamer successfully selected"""
-        streamers = self.driver.find_elements(*self.RANDOM_STREAMER_CARD)
-        visible = [s for s in streamers if s.is_displayed() and self.is_in_viewport(s)]
+        visible = self.query_elements(self.RANDOM_STREAMER_CARD, in_viewport=True)
 
         for streamer in visible:
             try:
                 self.perform_click(streamer)
                 self.wait_for_page_to_load()
                 self.handle_mature_content_popup()
-                self.driver.save_screenshot(Config.SCREENSHOT_STREAMER)
+                self.take_screenshot(Config.SCREENSHOT_STREAMER)
 
                 return True
             except (StaleElementReferenceException, ElementClickInterceptedException):
                 continue
         return False
 
+    def probe_playback(self, window=None):
+        """
+        Sample the streamer page <video> for 'window' seconds in one async script.
+        Returns time-to-first-frame, stall/buffering events, dropped/total frames
+        from getVideoPlaybackQuality() and the resolution in use.
+        Time-to-first-frame is measured from navigation start by the web vitals
+        collector; without it, from the start of the probe ('ttff_from').
+        """
+        window = window or Config.PLAYBACK_PROBE_WINDOW
+
+        script = """
+        const [selector, windowMs] = arguments;
+        const done = arguments[arguments.length - 1];
+        const video = document.querySelector(selector);
+        if (!video) {
+            return done(null);
+        }
+
+        const start = performance.now();
+        const fromNavigation = () => window.__vitals ? window.__vitals.firstFrame() : null;
+        const quality = () => video.getVideoPlaybackQuality
+            ? video.getVideoPlaybackQuality()
+            : {droppedVideoFrames: 0, totalVideoFrames: 0};
+        const initial = quality();
+        const alreadyPlaying = video.readyState >= 2 && video.currentTime > 0;
+        const metrics = {
+            already_playing: alreadyPlaying,
+            ttff_ms: null,
+            ttff_from: 'probe',
+            stalls: 0,
+            waiting: 0,
+            buffering_ms: 0,
+            resolutions: [],
+        };
+
+        let bufferingSince = null;
+        function firstFrame() {
+            if (metrics.ttff_ms === null) {
+                metrics.ttff_ms = performance.now() - start;
+            }
+        }
+        function endBuffering() {
+            if (bufferingSince !== null) {
+                metrics.buffering_ms += performance.now() - bufferingSince;
+                bufferingSince = null;
+            }
+        }
+        function onWaiting() {
+            metrics.waiting++;
+            if (bufferingSince === null) bufferingSince = performance.now();
+        }
+        function onStalled() { metrics.stalls++; }
+        function onPlaying() { endBuffering(); }
+        function onResize() {
+            metrics.resolutions.push(`${video.videoWidth}x${video.videoHeight}`);
+        }
+
+        if (!alreadyPlaying) {
+            if (video.requestVideoFrameCallback) {
+                video.requestVideoFrameCallback(firstFrame);
+            } else {
+                video.addEventListener('playing', firstFrame, {once: true});
+            }
+        }
+        video.addEventListener('waiting', onWaiting);
+        video.addEventListener('stalled', onStalled);
+        video.addEventListener('playing', onPlaying);
+        video.addEventListener('resize', onResize);
+
+        setTimeout(() => {
+            endBuffering();
+            video.removeEventListener('waiting', onWaiting);
+            video.removeEventListener('stalled', onStalled);
+            video.removeEventListener('playing', onPlaying);
+            video.removeEventListener('resize', onResize);
+
+            const final = quality();
+            metrics.dropped_frames = final.droppedVideoFrames - initial.droppedVideoFrames;
+            metrics.total_frames = final.totalVideoFrames - initial.totalVideoFrames;
+            metrics.width = video.videoWidth;
+            metrics.height = video.videoHeight;
+            metrics.paused = video.paused;
+            metrics.window_ms = performance.now() - start;
+            if (fromNavigation() !== null) {
+                metrics.ttff_ms = fromNavigation();
+                metrics.ttff_from = 'navigation';
+            }
+            done(metrics);
+        }, windowMs);
+        """
+
+        metrics = self.run_async_script(
+            script, self.VIDEO_PLAYER[1], window * 1000, timeout=window + 5
+        )
+        assert metrics is not None, Messages.VIDEO_NOT_FOUND
+
+        total = metrics["total_frames"]
+        metrics["dropped_ratio"] = metrics["dropped_frames"] / total if total else 0.0
+        self.logger.info(
+            f"Playback: ttff={metrics['ttff_ms']}ms ({metrics['ttff_from']}), stalls={metrics['stalls']}, "
+            f"buffering={metrics['buffering_ms']:.0f}ms, "
+            f"dropped={metrics['dropped_frames']}/{total}, "
+            f"resolution={metrics['width']}x{metrics['height']}"
+        )
+        return metrics
+
     # Assertion Methods
 
+    def assert_playback_quality(
+        self,
+        metrics=None,
+        max_ttff_ms=None,
+        max_stalls=None,
+        max_dropped_ratio=None,
+        min_height=None,
+    ):
+        """Assert playback metrics against optional thresholds"""
+        if metrics is None:
+            metrics = self.probe_playback()
+
+        if max_ttff_ms is not None:
+            ttff = metrics["ttff_ms"]
+            assert ttff is not None and ttff <= max_ttff_ms, Messages.PLAYBACK_TTFF_SLOW.format(
+                ttff if ttff is not None else float("inf"), max_ttff_ms
+            )
+        if max_stalls is not None:
+            assert metrics["stalls"] <= max_stalls, Messages.PLAYBACK_STALLS.format(
+                metrics["stalls"], max_stalls
+            )
+        if max_dropped_ratio is not None:
+            assert (
+                metrics["dropped_ratio"] <= max_dropped_ratio
+            ), Messages.PLAYBACK_DROPPED_FRAMES.format(
+                metrics["dropped_ratio"], max_dropped_ratio
+            )
+        if min_height is not None:
+            assert metrics["height"] >= min_height, Messages.PLAYBACK_RESOLUTION_LOW.format(
+                metrics["height"], min_height
+            )
+
+        self.logger.info("✓ Assertion passed: playback quality within thresholds")
+        return metrics
+
     def assert_on_home_page(self):
         """Verify we're on Twitch home page"""
         self.assert_url_contains("twitch.tv", Messages.URL_TWITCH_DOMAIN)
@@ -66,8 +328,9 @@ class TwitchHomePage(BasePage):
 
     def assert_search_opened(self):
         """Verify search interface is open"""
-        self.assert_element_visible(self.SEARCH_INPUT, Messages.SEARCH_INPUT_VISIBLE)
-        search_input = self.driver.find_element(*self.SEARCH_INPUT)
+        search_input = self.assert_element_visible(
+            self.SEARCH_INPUT, Messages.SEARCH_INPUT_VISIBLE
+        )
         assert search_input.is_enabled(), Messages.SEARCH_INPUT_ENABLED
         self.logger.info(Messages.SEARCH_OPENED_SUCCESS)
 
@@ -76,20 +339,22 @@ class TwitchHomePage(BasePage):
         # Check URL contains search context
         self.assert_url_contains("/directory", Messages.URL_DIRECTORY_PAGE)
 
-        # Verify streamer cards are present
-        streamers = self.assert_element_count_greater_than(
-            self.RANDOM_STREAMER_CARD,
-            1,
-            f"Should have at least 1 streamer card for '{search_term}'",
-        )
+        # Verify streamer cards are present (starts a fresh directory crawl)
+        self.wait_for_content_ready()
+        self.reset_crawl()
+        streamers = self.collect_streamers()
+        assert (
+            len(streamers) >= 1
+        ), f"Should have at least 1 streamer card for '{search_term}'"
 
         self.logger.info(f"✓ Search results loaded: {len(streamers)} streamers found")
-        return len(streamers)
+        return self.crawled_count
 
     def assert_more_content_after_scroll(self, initial_count):
         """Verify additional content loaded after scrolling"""
-        current_streamers = self.driver.find_elements(*self.RANDOM_STREAMER_CARD)
-        current_count = len(current_streamers)
+        # Only cards already in the DOM; scroll_page does the scrolling
+        self.collect_streamers()
+        current_count = self.crawled_count
 
         assert (
             current_count >= initial_count
@@ -119,17 +384,14 @@ class TwitchHomePage(BasePage):
 
     def get_visible_streamers(self):
         """Get list of visible, clickable streamers with assertions"""
-        all_streamers = self.driver.find_elements(*self.RANDOM_STREAMER_CARD)
-
-        visible_streamers = [
-            s
-            for s in all_streamers
-            if s.is_displayed() and s.is_enabled() and self.is_in_viewport(s)
-        ]
+        visible_streamers = self.query_elements(
+            self.RANDOM_STREAMER_CARD, enabled=True, in_viewport=True
+        )
 
-        assert (
-            len(visible_streamers) > 0
-        ), f"No visible streamers found. Total elements: {len(all_streamers)}"
+        assert visible_streamers, (
+            "No visible streamers found. Total elements: "
+            f"{len(self.driver.find_elements(*self.RANDOM_STREAMER_CARD))}"
+        )
 
         self.logger.info(
             f"✓ Found {len(visible_streamers)} visible/clickable streamers"
@@ -138,9 +400,16 @@ class TwitchHomePage(BasePage):
 
     def handle_mature_content_popup(self):
         """Handle mature content warning that some streamers show"""
+        if self.overlay_watchdog and not self.overlay_watchdog.is_present(
+            self.MATURE_WARNING
+        ):
+            self.overlay_watchdog.log_dismissals()
+            self.logger.info(Messages.MATURE_POPUP_NOT_PRESENT)
+            return
+
         try:
-            mature_button = self.wait.until(
-                EC.element_to_be_clickable(self.MATURE_WARNING)
+            mature_button = self.wait_until(
+                self.MATURE_WARNING, EC.element_to_be_clickable
             )
             self.logger.info(Messages.MATURE_DETECTED)
             mature_button.click()
@@ -1,34 +1,136 @@
+import functools
 import pytest
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
+from utils import artifacts
+from utils.browser_pool import BrowserPool
+from utils.cdp_transport import open_cdp_session
+from utils.command_profiler import profiler
+from utils.driver_factory import create_driver
+from utils.fast_mode import apply_fast_mode
+from utils.flow import flow_reports
+from utils.http_archive import start_archive_proxy
 from utils.config import Config
+from utils.latency_stats import get_latency_stats
+from utils.overlay_watchdog import install_overlay_watchdog
+from utils.web_vitals import flush_vitals, install_vitals_collector
+from utils.screenshot_service import flush_screenshots
+from utils.tracing import tracer
+
+_pool = None
+
+
+@pytest.fixture(scope="session")
+def archive_proxy():
+    """Record/replay proxy selected by TWITCH_NETWORK_MODE (None when live)."""
+    proxy = start_archive_proxy()
+
+    yield proxy
+
+    if proxy is not None:
+        proxy.stop()
+
+
+@pytest.fixture(scope="session")
+def browser_pool(archive_proxy):
+    """Pre-launched emulated-mobile Chrome sessions shared by the whole run."""
+    global _pool
+    address = archive_proxy.address if archive_proxy else None
+    _pool = BrowserPool(factory=functools.partial(create_driver, proxy=address))
+    _pool.start()
+
+    yield _pool
+
+    _pool.close()
+    get_latency_stats().save()
+
+
+@pytest.fixture(autouse=True)
+def artifact_scope(request):
+    """Route artifacts of each test into its own per-worker directory."""
+    artifacts.set_current_test(request.node.nodeid)
+    tracer.start_test(request.node.nodeid)
+    yield
+    tracer.export(artifacts.artifact_dir())
+    artifacts.set_current_test("session")
 
 
 @pytest.fixture(scope="function")
-def driver():
-    """Initializes Chrome with Mobile Emulation enabled."""
-    mobile_emulation = {"deviceName": Config.MOBILE_DEVICE}
-
-    options = webdriver.ChromeOptions()
-    options.add_experimental_option("mobileEmulation", mobile_emulation)
-
-    # Block notifications
-    prefs = {
-        "profile.default_content_setting_values.notifications": Config.NOTIFICATION_SETTING
-    }
-    options.add_experimental_option("prefs", prefs)
-    options.add_experimental_option("excludeSwitches", ["enable-logging"])
-    # Initialize Driver
-    try:
-        service = Service(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=options)
-    except Exception as e:
-        print(f"webdriver-manager failed: {e}")
-        print("Attempting to use system ChromeDriver...")
-        driver = webdriver.Chrome(options=options)
-        driver.set_window_size(400, 1100)
-
-    yield driver
-
-    driver.quit()
+def driver(browser_pool, request):
+    """Leases a pooled Chrome session and resets it after the test."""
+    session = browser_pool.acquire()
+    profiler.instrument(session.driver)
+
+    # Per-step limits: @pytest.mark.command_budget(select_random_streamer=10)
+    budget = request.node.get_closest_marker("command_budget")
+    profiler.set_budgets(budget.kwargs if budget else {})
+
+    # Per-test override: @pytest.mark.fast_mode(enabled=True, allow=["images"])
+    marker = request.node.get_closest_marker("fast_mode")
+    apply_fast_mode(session.driver, **(marker.kwargs if marker else {}))
+    if Config.OVERLAY_WATCHDOG:
+        install_overlay_watchdog(session.driver)
+    install_vitals_collector(session.driver)
+    if Config.TRANSPORT == "cdp":
+        open_cdp_session(session.driver)
+
+    yield session.driver
+
+    flush_vitals(session.driver, request.node.nodeid)
+    profiler.set_budgets({})
+    flush_screenshots(session.driver)
+    browser_pool.release(session)
+
+
+def pytest_terminal_summary(terminalreporter):
+    slowest = tracer.slowest()
+    if slowest:
+        terminalreporter.section("slowest steps")
+        for name, category, count, total, worst in slowest:
+            terminalreporter.write_line(
+                f"{total:8.2f}s  {category:<10} {name} (x{count}, max {worst:.2f}s)"
+            )
+        totals = tracer.category_totals()
+        terminalreporter.write_line(
+            "self time by category: "
+            + ", ".join(f"{cat} {secs:.2f}s" for cat, secs in sorted(totals.items()))
+        )
+
+    retried = [r for r in flow_reports if r["retries"]]
+    if flow_reports:
+        terminalreporter.section("flow retries")
+        terminalreporter.write_line(
+            f"{len(flow_reports)} flows, {sum(r['retries'] for r in flow_reports)} step retries, "
+            f"~{sum(r['saved_s'] for r in flow_reports):.1f}s saved vs full reruns"
+        )
+        for report in retried:
+            steps = ", ".join(
+                f"{name} x{s['attempts']}"
+                for name, s in report["steps"].items()
+                if s["attempts"] > 1
+            )
+            terminalreporter.write_line(f"  {report['flow']}: {steps}")
+
+    per_test = profiler.by("test")
+    if per_test:
+        terminalreporter.section("webdriver commands")
+        for test, (count, total) in sorted(per_test.items(), key=lambda i: -i[1][0]):
+            terminalreporter.write_line(f"{count:6d} cmds {total:7.2f}s  {test}")
+        for field in ("caller", "command"):
+            rows = sorted(profiler.by(field).items(), key=lambda i: -i[1][0])[:10]
+            terminalreporter.write_line(f"top by {field}:")
+            for name, (count, total) in rows:
+                terminalreporter.write_line(
+                    f"{count:6d} cmds {total:7.2f}s  {name} (avg {total / count * 1000:.1f}ms)"
+                )
+
+    if _pool is None:
+        return
+    stats = _pool.stats()
+    terminalreporter.section("browser pool")
+    terminalreporter.write_line(
+        f"launches: {stats['launches']} (avg {stats['avg_launch_s']:.2f}s), "
+        f"resets: {stats['resets']} (avg {stats['avg_reset_s']:.2f}s), "
+        f"recycled: {stats['recycled']}"
+    )
+    terminalreporter.write_line(
+        f"estimated time saved vs relaunching: {stats['saved_s']:.2f}s"
+    )
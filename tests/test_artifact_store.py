@@ -0,0 +1,117 @@
+import json
+import os
+import struct
+import zlib
+import pytest
+from utils.artifact_store import ArtifactStore, dhash, mean_brightness
+from utils.config import Config
+
+
+def png(width, height, pixel):
+    """Uncompressed-filter RGB PNG; pixel(x, y) -> (r, g, b)."""
+
+    def chunk(kind, body):
+        crc = zlib.crc32(kind + body) & 0xFFFFFFFF
+        return struct.pack(">I", len(body)) + kind + body + struct.pack(">I", crc)
+
+    raw = b"".join(
+        b"\x00" + bytes(c for x in range(width) for c in pixel(x, y)) for y in range(height)
+    )
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0))
+        + chunk(b"IDAT", zlib.compress(raw))
+        + chunk(b"IEND", b"")
+    )
+
+
+def solid(value):
+    return png(9, 8, lambda x, y: (value, value, value))
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ArtifactStore(root=str(tmp_path), max_bytes=10_000)
+
+
+def put_frame(store, frame, test="test_a", step="01_home_page", run="run"):
+    return store.put(
+        frame,
+        "png",
+        phash=dhash(frame),
+        luma=mean_brightness(frame),
+        test=test,
+        step=step,
+        run=run,
+    )
+
+
+def test_put_writes_blob_and_manifest(store):
+    entry = put_frame(store, solid(200))
+
+    assert entry["duplicate"] is None
+    assert os.path.exists(entry["path"])
+    with open(os.path.join(store.root, "manifests", "run.jsonl"), encoding="utf-8") as f:
+        assert [json.loads(line)["blob"] for line in f] == [entry["blob"]]
+
+
+def test_exact_duplicate_is_stored_once(store):
+    first = put_frame(store, solid(200))
+    second = put_frame(store, solid(200), test="test_b")
+
+    assert second["duplicate"] == "exact"
+    assert second["blob"] == first["blob"]
+
+
+def test_near_duplicate_within_same_test_and_step(store):
+    first = put_frame(store, solid(200))
+    second = put_frame(store, solid(202))
+
+    assert second["duplicate"] == "near"
+    assert second["blob"] == first["blob"]
+
+
+def test_near_duplicate_not_shared_across_tests(store):
+    first = put_frame(store, solid(200))
+    second = put_frame(store, solid(202), test="test_b")
+
+    assert second["duplicate"] is None
+    assert second["blob"] != first["blob"]
+
+
+def test_near_duplicate_not_shared_across_runs(store):
+    first = put_frame(store, solid(200))
+    second = put_frame(store, solid(202), run="next")
+
+    assert second["duplicate"] is None
+    assert second["blob"] != first["blob"]
+
+
+def test_near_duplicate_requires_similar_brightness(store):
+    white, black = solid(255), solid(0)
+    assert dhash(white) == dhash(black)
+
+    put_frame(store, white)
+    entry = put_frame(store, black)
+
+    assert entry["duplicate"] is None
+
+
+def test_failure_captures_are_always_kept(store):
+    step = f"{Config.SCREENSHOT_FAILURE_PREFIX}03_before_scroll"
+    put_frame(store, solid(200), step=step)
+    entry = put_frame(store, solid(202), step=step)
+
+    assert entry["duplicate"] is None
+    assert os.path.exists(entry["path"])
+
+
+def test_evict_drops_least_recently_used(store):
+    store.max_bytes = 1
+    old = put_frame(store, solid(10), step="a")
+    new = put_frame(store, solid(100), step="b")
+
+    index = store._read_index()
+    assert list(index) == [new["blob"]]
+    assert not os.path.exists(old["path"])
+    assert os.path.exists(new["path"])
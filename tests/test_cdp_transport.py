@@ -0,0 +1,141 @@
+import base64
+import hashlib
+import json
+import socket
+import struct
+import threading
+import pytest
+from selenium.common.exceptions import TimeoutException
+from utils.cdp_transport import CdpSession
+
+WS_GUID = b"258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+
+class FakeDevTools:
+    """
+    Minimal DevTools endpoint: /json target list plus a websocket that answers
+    Runtime.evaluate with 42, and never answers awaited promises.
+    """
+
+    def __init__(self):
+        self.server = socket.socket()
+        self.server.bind(("127.0.0.1", 0))
+        self.server.listen()
+        self.address = f"127.0.0.1:{self.server.getsockname()[1]}"
+        self.connections = 0
+        threading.Thread(target=self._accept, daemon=True).start()
+
+    def _accept(self):
+        while True:
+            try:
+                conn, _ = self.server.accept()
+            except OSError:
+                return
+            threading.Thread(target=self._serve, args=(conn,), daemon=True).start()
+
+    def _serve(self, conn):
+        request = b""
+        while b"\r\n\r\n" not in request:
+            request += conn.recv(4096)
+        head = request.decode()
+        if "Upgrade: websocket" not in head:
+            url = f"ws://{self.address}/devtools/page/target"
+            body = json.dumps(
+                [{"id": "target", "type": "page", "webSocketDebuggerUrl": url}]
+            ).encode()
+            conn.sendall(
+                b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                + f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode()
+                + body
+            )
+            conn.close()
+            return
+
+        self.connections += 1
+        key = next(
+            line.split(":", 1)[1].strip()
+            for line in head.split("\r\n")
+            if line.lower().startswith("sec-websocket-key")
+        )
+        accept = base64.b64encode(hashlib.sha1(key.encode() + WS_GUID).digest()).decode()
+        conn.sendall(
+            (
+                "HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\n"
+                f"Connection: Upgrade\r\nSec-WebSocket-Accept: {accept}\r\n\r\n"
+            ).encode()
+        )
+        try:
+            while True:
+                opcode, text = self._read_frame(conn)
+                if opcode == 0x8:
+                    break
+                message = json.loads(text)
+                if message["params"].get("awaitPromise"):
+                    continue
+                reply = {"id": message["id"], "result": {"result": {"value": 42}}}
+                payload = json.dumps(reply).encode()
+                conn.sendall(bytes([0x81, len(payload)]) + payload)
+        except (OSError, ConnectionError):
+            pass
+        conn.close()
+
+    @staticmethod
+    def _read_frame(conn):
+        def read(size):
+            data = b""
+            while len(data) < size:
+                chunk = conn.recv(size - len(data))
+                if not chunk:
+                    raise ConnectionError
+                data += chunk
+            return data
+
+        first, second = read(2)
+        length = second & 0x7F
+        if length == 126:
+            (length,) = struct.unpack(">H", read(2))
+        elif length == 127:
+            (length,) = struct.unpack(">Q", read(8))
+        mask = read(4)
+        payload = read(length)
+        text = bytes(b ^ mask[i % 4] for i, b in enumerate(payload)).decode()
+        return first & 0x0F, text
+
+    def stop(self):
+        self.server.close()
+
+
+class FakeDriver:
+    current_window_handle = "target"
+
+    def __init__(self, address):
+        self.capabilities = {"goog:chromeOptions": {"debuggerAddress": address}}
+
+
+@pytest.fixture
+def devtools():
+    server = FakeDevTools()
+    yield server
+    server.stop()
+
+
+def test_execute_script_round_trip(devtools):
+    session = CdpSession(FakeDriver(devtools.address), timeout=5)
+
+    assert session.execute_script("return 42;") == 42
+    session.close()
+
+
+def test_async_timeout_reconnects_and_raises_timeout(devtools):
+    session = CdpSession(FakeDriver(devtools.address), timeout=5)
+    first = session.ws
+
+    with pytest.raises(TimeoutException):
+        session.execute_async_script("/* never resolves */", timeout=0.2)
+
+    assert session.ws is not first
+    assert devtools.connections == 2
+    assert session.ws.sock.gettimeout() == 5
+    # The fresh connection is usable
+    assert session.execute_script("return 42;") == 42
+    session.close()
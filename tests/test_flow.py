@@ -0,0 +1,146 @@
+import pytest
+from selenium.common.exceptions import StaleElementReferenceException
+from utils import flow as flow_module
+from utils.config import Config
+from utils.flow import Flow
+
+URL = "https://m.twitch.tv/directory"
+
+
+class FakeDriver:
+    def __init__(self):
+        self.calls = []
+
+    def get_cookies(self):
+        return [{"name": "consent", "value": "1", "domain": "m.twitch.tv", "secure": True}]
+
+    def execute_cdp_cmd(self, method, params):
+        self.calls.append((method, params))
+
+    def get(self, url):
+        self.calls.append(("get", url))
+
+    def execute_script(self, script, *args):
+        self.calls.append(("seed", args))
+
+
+class FakePage:
+    element_cache = None
+
+    def __init__(self):
+        self.driver = FakeDriver()
+
+    def run_script(self, script, *args):
+        if "location.href" in script:
+            return {
+                "url": URL,
+                "scroll_y": 300,
+                "local": {"theme": "dark"},
+                "session": {"tab": "1"},
+            }
+        self.driver.calls.append(("script", args))
+
+    def wait_for_page_to_load(self):
+        self.driver.calls.append(("loaded",))
+
+
+def flaky(failures, error=StaleElementReferenceException):
+    """Step that raises 'error' on its first 'failures' calls."""
+    calls = []
+
+    def step(ctx):
+        calls.append(dict(ctx))
+        if len(calls) <= failures:
+            raise error("flaky")
+
+    step.calls = calls
+    return step
+
+
+@pytest.fixture
+def page(monkeypatch):
+    # Keep these flows out of the run's retry summary
+    monkeypatch.setattr(flow_module, "flow_reports", [])
+    return FakePage()
+
+
+def test_retries_only_from_last_checkpoint(page):
+    flow = Flow(page, "flow", retries=2)
+    first, second, third = flaky(0), flaky(0), flaky(1)
+    flow.step("first")(first)
+    flow.step("second")(second)
+    flow.step("third", checkpoint=False)(third)
+
+    flow.run()
+
+    assert (len(first.calls), len(second.calls), len(third.calls)) == (1, 2, 2)
+    assert flow.report["retries"] == 1
+    assert flow.report["steps"]["third"]["attempts"] == 2
+
+
+def test_context_rolled_back_to_checkpoint(page):
+    flow = Flow(page, "flow", retries=1)
+
+    @flow.step("setup")
+    def setup(ctx):
+        ctx["setup"] = True
+
+    step = flaky(1)
+
+    @flow.step("work")
+    def work(ctx):
+        step(ctx)
+        ctx["work"] = True
+
+    flow.run()
+
+    assert step.calls == [{"setup": True}, {"setup": True}]
+    assert flow.context == {"setup": True, "work": True}
+
+
+def test_assertion_failures_are_not_retried(page):
+    flow = Flow(page, "flow", retries=2)
+    step = flaky(1, error=AssertionError)
+    flow.step("check")(step)
+
+    with pytest.raises(AssertionError):
+        flow.run()
+
+    assert len(step.calls) == 1
+    assert flow.report["retries"] == 0
+
+
+def test_gives_up_when_retries_exhausted(page):
+    flow = Flow(page, "flow", retries=1)
+    step = flaky(5)
+    flow.step("step")(step)
+
+    with pytest.raises(StaleElementReferenceException):
+        flow.run()
+
+    assert len(step.calls) == 2
+
+
+def test_restore_seeds_storage_before_navigating(page):
+    flow = Flow(page, "flow", retries=1)
+    flow.step("step")(flaky(1))
+
+    flow.run()
+
+    calls = [call[0] for call in page.driver.calls]
+    assert calls == [
+        "Network.clearBrowserCookies",
+        "script",
+        "Network.setCookies",
+        "get",
+        "seed",
+        "get",
+        "loaded",
+        "script",
+    ]
+    cookies = page.driver.calls[2][1]["cookies"]
+    assert cookies[0]["secure"] is True
+    assert page.driver.calls[3][1].endswith(Config.STATE_SNAPSHOT_SEED_PATH)
+    assert page.driver.calls[4][1] == ({"theme": "dark"}, {"tab": "1"})
+    assert page.driver.calls[5][1] == URL
+    assert page.driver.calls[7][1] == (300,)
@@ -0,0 +1,61 @@
+import pytest
+from utils.config import Config
+from utils.latency_stats import LatencyStats, percentile
+
+KEY = "TwitchPage::search_input"
+
+
+@pytest.fixture
+def stats(tmp_path):
+    return LatencyStats(str(tmp_path / "latency.json"))
+
+
+def record(stats, seconds, found=True):
+    for value in seconds:
+        stats.record(KEY, value, found)
+
+
+def test_percentile_picks_nearest_rank():
+    values = list(range(1, 101))
+
+    assert percentile(values, 0.5) == 51
+    assert percentile(values, 0.99) == 100
+    assert percentile([3.0], 0.99) == 3.0
+
+
+def test_default_timeout_until_min_samples(stats):
+    record(stats, [1.0] * (Config.ADAPTIVE_MIN_SAMPLES - 1))
+
+    assert stats.timeout_for(KEY, 10) == 10
+    assert stats.poll_for(KEY) == 0.5
+
+
+def test_timeout_is_p99_times_margin(stats):
+    record(stats, [1.0] * (Config.ADAPTIVE_MIN_SAMPLES - 1) + [2.0])
+
+    assert stats.timeout_for(KEY, 10) == pytest.approx(2.0 * Config.ADAPTIVE_MARGIN)
+
+
+def test_timeout_clamped_to_min_and_default(stats):
+    record(stats, [0.01] * Config.ADAPTIVE_MIN_SAMPLES)
+    assert stats.timeout_for(KEY, 10) == Config.ADAPTIVE_MIN_TIMEOUT
+
+    record(stats, [30.0] * Config.ADAPTIVE_MIN_SAMPLES)
+    assert stats.timeout_for(KEY, 10) == 10
+
+
+def test_never_found_uses_absent_timeout(stats):
+    record(stats, [10.0] * Config.ADAPTIVE_MIN_SAMPLES, found=False)
+
+    assert stats.timeout_for(KEY, 10) == Config.ADAPTIVE_ABSENT_TIMEOUT
+    assert stats.found_ratio(KEY) == 0
+
+
+def test_save_merges_with_samples_on_disk(stats):
+    other = LatencyStats(stats.path)
+    record(other, [1.0])
+    other.save()
+    record(stats, [2.0])
+    stats.save()
+
+    assert LatencyStats(stats.path).load().samples[KEY] == [[1.0, True], [2.0, True]]
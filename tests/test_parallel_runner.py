@@ -0,0 +1,82 @@
+import sys
+import xml.etree.ElementTree as ET
+import pytest
+from utils import parallel_runner
+from utils.config import Config
+
+TEST_FILE = "tests/test_twich.py"
+NODE_A = f"{TEST_FILE}::test_a"
+NODE_B = f"{TEST_FILE}::test_b"
+
+
+@pytest.fixture
+def artifacts_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(Config, "ARTIFACTS_DIR", str(tmp_path))
+    return tmp_path
+
+
+def test_shard_balances_by_recorded_duration():
+    items = [(NODE_A, "Pixel 7"), (NODE_B, "Pixel 7"), (NODE_A, "iPhone")]
+    durations = {
+        "Pixel 7::" + NODE_A: 30.0,
+        "Pixel 7::" + NODE_B: 10.0,
+        "iPhone::" + NODE_A: 20.0,
+    }
+
+    shards = parallel_runner.shard(items, 2, durations)
+
+    assert sorted(map(len, shards)) == [1, 2]
+    assert [(NODE_A, "Pixel 7")] in shards
+    assert sorted(item for s in shards for item in s) == sorted(items)
+
+
+def test_shard_drops_empty_workers():
+    shards = parallel_runner.shard([(NODE_A, "Pixel 7")], 4, {})
+
+    assert shards == [[(NODE_A, "Pixel 7")]]
+
+
+def test_worker_commands_forward_options_only(artifacts_dir):
+    items = [(NODE_A, "Pixel 7"), (NODE_B, "Pixel 7"), (NODE_A, "iPhone")]
+    pytest_args = [TEST_FILE, "-x", "-k", "search", NODE_B]
+
+    commands = parallel_runner.worker_commands(0, items, pytest_args)
+
+    assert [device for device, _, _ in commands] == ["Pixel 7", "iPhone"]
+    device, report, command = commands[0]
+    assert report.startswith(str(artifacts_dir / "gw0"))
+    assert command == [
+        sys.executable,
+        "-m",
+        "pytest",
+        f"--junitxml={report}",
+        "-x",
+        "-k",
+        "search",
+        NODE_A,
+        NODE_B,
+    ]
+    assert commands[1][2][-1:] == [NODE_A]
+
+
+def test_merge_reports_tags_devices_and_collects_durations(artifacts_dir):
+    reports = []
+    for index, (device, outcome) in enumerate((("Pixel 7", None), ("iPhone", "failure"))):
+        suite = ET.Element("testsuite")
+        case = ET.SubElement(
+            suite, "testcase", classname="tests.test_twich", name="test_a", time="1.5"
+        )
+        if outcome:
+            ET.SubElement(case, outcome)
+        path = artifacts_dir / f"junit-{index}.xml"
+        ET.ElementTree(suite).write(path)
+        reports.append((device, str(path)))
+    reports.append(("Pixel 7", str(artifacts_dir / "missing.xml")))
+    output = artifacts_dir / "junit.xml"
+
+    durations, totals = parallel_runner.merge_reports(reports, str(output))
+
+    assert totals == {"tests": 2, "failures": 1, "errors": 0, "skipped": 0}
+    assert durations == {"Pixel 7::" + NODE_A: 1.5, "iPhone::" + NODE_A: 1.5}
+    names = [case.get("name") for case in ET.parse(output).getroot().iter("testcase")]
+    assert names == ["test_a[Pixel 7]", "test_a[iPhone]"]
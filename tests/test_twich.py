@@ -1,8 +1,11 @@
+import pytest
 from pages.twitch_page import TwitchHomePage
 from utils.config import Config, Messages
+from utils.flow import Flow
 from tests.conftest import driver
 
 
+@pytest.mark.command_budget(select_random_streamer=25, scroll_page=8)
 def test_twitch_mobile_search_flow(driver):
     """
     Test Case:
@@ -12,53 +15,67 @@ def test_twitch_mobile_search_flow(driver):
     4. Scroll down 2 times
     5. Select one streamer
     """
-    twitch = TwitchHomePage(driver)
+    twitch = TwitchHomePage(driver, cache_elements=True)
+    flow = Flow(twitch, "twitch_mobile_search")
 
     # 1. Go to Twitch
-    twitch.navigate_to_twitch()
-    twitch.assert_on_home_page()
+    @flow.step("open_home")
+    def open_home(ctx):
+        twitch.navigate_to_twitch()
+        twitch.assert_on_home_page()
 
-    # Handle Cookie Popup
-    twitch.handle_popup()
+        # Handle Cookie Popup
+        twitch.handle_popup()
 
     # 2 Click search icon
-    twitch.assert_element_clickable(
-        twitch.SEARCH_ICON,
-    )
-    twitch.perform_click(twitch.SEARCH_ICON)
-    twitch.assert_search_opened()
+    @flow.step("open_search")
+    def open_search(ctx):
+        twitch.assert_element_clickable(
+            twitch.SEARCH_ICON,
+        )
+        twitch.perform_click(twitch.SEARCH_ICON)
+        twitch.assert_search_opened()
 
     # 3. Enter Text "StarCraft II" and click search
+    @flow.step("search", checkpoint=False)
+    def search(ctx):
+        # ASSERTION before action: Input should be visible and enabled
+        search_input = twitch.assert_element_visible(
+            twitch.SEARCH_INPUT, Messages.SEARCH_INPUT_VISIBLE
+        )
+        assert search_input.is_enabled(), Messages.SEARCH_INPUT_ENABLED
 
-    # ASSERTION before action: Input should be visible and enabled
-    search_input = twitch.assert_element_visible(
-        twitch.SEARCH_INPUT, Messages.SEARCH_INPUT_VISIBLE
-    )
-    assert search_input.is_enabled(), Messages.SEARCH_INPUT_ENABLED
+        twitch.enter_text(twitch.SEARCH_INPUT, Config.STARCRAFT_SEARCH_TERM)
+        # Allow suggestions to load
+        twitch.assert_element_visible(
+            twitch.STARCRAFT_II_OPTION,
+            Messages.SEARCH_SUGGESTIONS_APPEAR.format(Config.STARCRAFT_SEARCH_TERM),
+        )
 
-    twitch.enter_text(twitch.SEARCH_INPUT, Config.STARCRAFT_SEARCH_TERM)
-    # Allow suggestions to load
-    twitch.assert_element_visible(
-        twitch.STARCRAFT_II_OPTION,
-        Messages.SEARCH_SUGGESTIONS_APPEAR.format(Config.STARCRAFT_SEARCH_TERM),
-    )
-
-    # Select first Suggestion from list
-    twitch.perform_click(twitch.STARCRAFT_II_OPTION)
-    twitch.wait_for_page_to_load()
+        # Select first Suggestion from list
+        twitch.perform_click(twitch.STARCRAFT_II_OPTION)
+        twitch.wait_for_page_to_load()
 
     # 4. Scroll down 2 times
-    initial_count = twitch.assert_search_results_loaded(Config.STARCRAFT_SEARCH_TERM)
-    driver.save_screenshot(Config.SCREENSHOT_BEFORE_SCROLL)
+    @flow.step("scroll")
+    def scroll(ctx):
+        with twitch.screenshot_step(Config.SCREENSHOT_BEFORE_SCROLL):
+            initial_count = twitch.assert_search_results_loaded(
+                Config.STARCRAFT_SEARCH_TERM
+            )
 
-    current_count = initial_count
-    for i in range(2):
-        twitch.scroll_page(times=1)
-        current_count = twitch.assert_more_content_after_scroll(current_count)
-        driver.save_screenshot(Config.SCREENSHOT_AFTER_SCROLL.format(i + 1))
+        current_count = initial_count
+        for i in range(2):
+            with twitch.screenshot_step(Config.SCREENSHOT_AFTER_SCROLL.format(i + 1)):
+                twitch.scroll_page(times=1)
+                current_count = twitch.assert_more_content_after_scroll(current_count)
 
-    #
     # 5. Select a streamer
-    streamer_selected = twitch.select_random_streamer()
-    assert streamer_selected, Messages.STREAMER_SELECTION_FAILED
-    twitch.assert_on_streamer_page()
+    @flow.step("select_streamer")
+    def select_streamer(ctx):
+        streamer_selected = twitch.select_random_streamer()
+        assert streamer_selected, Messages.STREAMER_SELECTION_FAILED
+        twitch.assert_on_streamer_page()
+
+    flow.run()
+    twitch.logger.info(f"Element cache: {twitch.element_cache.stats()}")
@@ -0,0 +1,31 @@
+import pytest
+from utils.config import Config
+from utils.web_vitals import is_measured
+
+
+def segment(url, kind="navigation", **metrics):
+    return dict({"url": url, "kind": kind, "long_tasks": 0, "cls": 0, "inp": None}, **metrics)
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "about:blank",
+        "data:,",
+        "chrome-error://chromewebdata/",
+        "https://m.twitch.tv" + Config.STATE_SNAPSHOT_SEED_PATH,
+    ],
+)
+def test_blank_and_seed_pages_are_skipped(url):
+    assert not is_measured(segment(url))
+
+
+def test_navigation_segments_are_kept():
+    assert is_measured(segment("https://m.twitch.tv/directory"))
+
+
+def test_continued_segments_kept_only_with_activity():
+    url = "https://m.twitch.tv/directory"
+
+    assert not is_measured(segment(url, kind="continued"))
+    assert is_measured(segment(url, kind="continued", cls=0.1))
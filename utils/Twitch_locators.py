@@ -19,6 +19,9 @@ class TwitchLocators:
     # Content
     STREAMER_CARD = (By.CSS_SELECTOR, "article a[href$='/home'].tw-link")
 
+    # Player
+    VIDEO_PLAYER = (By.CSS_SELECTOR, "video")
+
     # Popups
     COOKIE_BANNER = (By.CSS_SELECTOR, 'div[data-a-target="consent-banner"]')
     COOKIE_ACCEPT = (By.CSS_SELECTOR, 'button[data-a-target="consent-banner-accept"]')
@@ -0,0 +1,212 @@
+"""
+Content-addressed screenshot/artifact store.
+
+Blobs are keyed by SHA-256 of their bytes, so identical frames are stored
+once. A frame of the same run, test and step whose perceptual hash (dHash of a
+tiny thumbnail) is within Config.ARTIFACT_PHASH_DISTANCE and whose mean
+brightness is within Config.ARTIFACT_LUMA_DELTA of a stored blob reuses that
+blob; failure captures are always kept. Each run keeps a manifest linking
+test and step to blob; total size is bounded with least-recently-used
+eviction.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import struct
+import threading
+import time
+import zlib
+from utils.config import Config
+from utils.file_io import FileLock, write_json_atomic
+
+
+def decode_png(data):
+    """(width, height, rows of RGB tuples) for an 8-bit RGB/RGBA PNG."""
+    if data[:8] != b"\x89PNG\r\n\x1a\n":
+        raise ValueError("Not a PNG")
+    offset, idat = 8, b""
+    width = height = color_type = None
+    while offset < len(data):
+        (length,) = struct.unpack(">I", data[offset : offset + 4])
+        chunk_type = data[offset + 4 : offset + 8]
+        body = data[offset + 8 : offset + 8 + length]
+        if chunk_type == b"IHDR":
+            width, height, depth, color_type = struct.unpack(">IIBB", body[:10])
+            if depth != 8 or color_type not in (2, 6):
+                raise ValueError("Unsupported PNG format")
+        elif chunk_type == b"IDAT":
+            idat += body
+        elif chunk_type == b"IEND":
+            break
+        offset += 12 + length
+
+    channels = 4 if color_type == 6 else 3
+    stride = width * channels
+    raw = zlib.decompress(idat)
+    rows, previous = [], bytearray(stride)
+    for y in range(height):
+        start = y * (stride + 1)
+        kind, line = raw[start], bytearray(raw[start + 1 : start + 1 + stride])
+        for x in range(stride):
+            left = line[x - channels] if x >= channels else 0
+            up = previous[x]
+            up_left = previous[x - channels] if x >= channels else 0
+            if kind == 1:
+                line[x] = (line[x] + left) & 0xFF
+            elif kind == 2:
+                line[x] = (line[x] + up) & 0xFF
+            elif kind == 3:
+                line[x] = (line[x] + (left + up) // 2) & 0xFF
+            elif kind == 4:
+                p = left + up - up_left
+                pa, pb, pc = abs(p - left), abs(p - up), abs(p - up_left)
+                predictor = left if pa <= pb and pa <= pc else up if pb <= pc else up_left
+                line[x] = (line[x] + predictor) & 0xFF
+        rows.append([tuple(line[i : i + 3]) for i in range(0, stride, channels)])
+        previous = line
+    return width, height, rows
+
+
+def _grayscale(png):
+    width, height, rows = decode_png(png)
+    gray = [[(r * 299 + g * 587 + b * 114) // 1000 for r, g, b in row] for row in rows]
+    return width, height, gray
+
+
+def mean_brightness(png_thumbnail):
+    """Mean luma (0-255) of a small PNG; dHash alone ignores brightness."""
+    _, _, gray = _grayscale(png_thumbnail)
+    values = [value for row in gray for value in row]
+    return sum(values) / len(values)
+
+
+def dhash(png_thumbnail):
+    """64-bit difference hash from a small PNG (resampled to 9x8 grayscale)."""
+    width, height, gray = _grayscale(png_thumbnail)
+
+    def cell(cx, cy):
+        x0, x1 = cx * width // 9, max(cx * width // 9 + 1, (cx + 1) * width // 9)
+        y0, y1 = cy * height // 8, max(cy * height // 8 + 1, (cy + 1) * height // 8)
+        values = [gray[y][x] for y in range(y0, y1) for x in range(x0, x1)]
+        return sum(values) / len(values)
+
+    bits = 0
+    for cy in range(8):
+        cells = [cell(cx, cy) for cx in range(9)]
+        for cx in range(8):
+            bits = (bits << 1) | (cells[cx] < cells[cx + 1])
+    return bits
+
+
+class ArtifactStore:
+    def __init__(self, root=None, max_bytes=None):
+        self.root = root or Config.ARTIFACT_STORE_DIR
+        self.max_bytes = max_bytes or Config.ARTIFACT_STORE_MAX_BYTES
+        self.index_path = os.path.join(self.root, "index.json")
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._lock = threading.Lock()
+
+    def put(
+        self, data, extension, phash=None, luma=None, test=None, step=None, run=None
+    ):
+        """
+        Store a blob unless an exact duplicate, or a near duplicate of the
+        same run, test and step, exists; record it in the run manifest.
+        Returns the manifest entry.
+        """
+        digest = hashlib.sha256(data).hexdigest()
+        # Later runs keep their own frames instead of pointing at an old one
+        scope = f"{run}::{test}::{step}"
+        near_allowed = (
+            phash is not None
+            and luma is not None
+            and not (step or "").startswith(Config.SCREENSHOT_FAILURE_PREFIX)
+        )
+        os.makedirs(self.root, exist_ok=True)
+        with self._lock, FileLock(os.path.join(self.root, "index.lock")):
+            index = self._read_index()
+            duplicate = "exact" if digest in index else None
+
+            if duplicate is None and near_allowed:
+                near = self._nearest(index, phash, luma, scope)
+                if near is not None:
+                    digest, duplicate = near, "near"
+
+            if duplicate is None:
+                path = self.blob_path(digest, extension)
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                with open(path, "wb") as f:
+                    f.write(data)
+                index[digest] = {
+                    "ext": extension,
+                    "size": len(data),
+                    "phash": phash,
+                    "luma": luma,
+                    "scope": scope,
+                }
+
+            index[digest]["last_used"] = time.time()
+            self._evict(index, keep=digest)
+            self._write_index(index)
+            entry = {
+                "run": run,
+                "test": test,
+                "step": step,
+                "blob": digest,
+                "path": self.blob_path(digest, index[digest]["ext"]),
+                "duplicate": duplicate,
+                "at": time.time(),
+            }
+
+        self._append_manifest(run, entry)
+        return entry
+
+    def blob_path(self, digest, extension):
+        return os.path.join(self.root, "blobs", digest[:2], f"{digest}.{extension}")
+
+    def _nearest(self, index, phash, luma, scope):
+        """Closest stored blob of the same run, test and step with similar brightness."""
+        best, best_distance = None, Config.ARTIFACT_PHASH_DISTANCE + 1
+        for digest, meta in index.items():
+            if meta.get("scope") != scope or None in (meta.get("phash"), meta.get("luma")):
+                continue
+            if abs(meta["luma"] - luma) > Config.ARTIFACT_LUMA_DELTA:
+                continue
+            distance = bin(meta["phash"] ^ phash).count("1")
+            if distance < best_distance:
+                best, best_distance = digest, distance
+        return best
+
+    def _evict(self, index, keep):
+        """Drop least-recently-used blobs until the store fits max_bytes."""
+        total = sum(meta["size"] for meta in index.values())
+        for digest, meta in sorted(index.items(), key=lambda item: item[1]["last_used"]):
+            if total <= self.max_bytes:
+                break
+            if digest == keep:
+                continue
+            try:
+                os.remove(self.blob_path(digest, meta["ext"]))
+            except FileNotFoundError:
+                pass
+            total -= meta["size"]
+            del index[digest]
+            self.logger.debug(f"Evicted blob {digest[:12]}")
+
+    def _append_manifest(self, run, entry):
+        path = os.path.join(self.root, "manifests", f"{run or 'adhoc'}.jsonl")
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry) + "\n")
+
+    def _read_index(self):
+        try:
+            with open(self.index_path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _write_index(self, index):
+        write_json_atomic(self.index_path, index)
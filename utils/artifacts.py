@@ -0,0 +1,60 @@
+"""
+Per-worker, per-device, per-test artifact paths.
+Keeps parallel workers from overwriting each other's screenshots.
+"""
+
+import os
+import re
+import time
+from utils.config import Config
+
+_current_test = "session"
+_run_id = None
+
+
+def _sanitize(value):
+    return re.sub(r"[^\w.\-\[\]]+", "_", value).strip("_")
+
+
+def worker_id():
+    """Identifier of the current worker process ('main' when not sharded)."""
+    return os.environ.get(Config.WORKER_ID_ENV, "main")
+
+
+def run_id():
+    """
+    Id shared by every worker of a run: the runner's TWITCH_RUN_ID, or one
+    timestamp per process when running pytest directly.
+    """
+    global _run_id
+    if _run_id is None:
+        _run_id = os.environ.get(Config.RUN_ID_ENV) or time.strftime("%Y%m%d-%H%M%S")
+    return _run_id
+
+
+def set_current_test(nodeid):
+    """Record the test whose artifacts are being written."""
+    global _current_test
+    _current_test = _sanitize(nodeid) or "session"
+
+
+def current_test():
+    """Sanitized id of the test currently writing artifacts."""
+    return _current_test
+
+
+def device_id():
+    """Sanitized name of the emulated device profile of this process."""
+    return _sanitize(Config.MOBILE_DEVICE) or "default"
+
+
+def artifact_dir():
+    """Directory for the current worker, device and test (not created here)."""
+    return os.path.join(Config.ARTIFACTS_DIR, worker_id(), device_id(), _current_test)
+
+
+def artifact_path(name):
+    """Path for an artifact file of the current test; creates its directory."""
+    directory = artifact_dir()
+    os.makedirs(directory, exist_ok=True)
+    return os.path.join(directory, name)
@@ -0,0 +1,155 @@
+"""
+Session-scoped pool of pre-launched Chrome sessions.
+Sessions are reset between tests instead of being quit and relaunched.
+"""
+
+import logging
+import time
+from urllib.parse import urlparse
+from selenium.common.exceptions import WebDriverException
+from utils.cdp_transport import close_cdp_session
+from utils.config import Config
+from utils.driver_factory import create_driver
+from utils.network_monitor import get_network_monitor
+from utils.overlay_watchdog import get_overlay_watchdog
+from utils.screenshot_service import shutdown_screenshots
+
+
+class PooledSession:
+    """A pooled driver together with its reuse counter"""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.uses = 0
+
+
+class BrowserPool:
+    def __init__(self, size=None, max_reuse=None, factory=create_driver):
+        self.size = size or Config.POOL_SIZE
+        self.max_reuse = max_reuse or Config.POOL_MAX_REUSE
+        self.factory = factory
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+        self._idle = []
+        self._launch_times = []
+        self._reset_times = []
+        self.recycled = 0
+
+    def start(self):
+        """Pre-launch all sessions in the pool."""
+        for _ in range(self.size):
+            self._idle.append(self._launch())
+        self.logger.info(f"✓ Browser pool started with {self.size} session(s)")
+
+    def acquire(self):
+        """Take an idle session, launching a new one if the pool is empty."""
+        session = self._idle.pop() if self._idle else self._launch()
+        if not self._is_healthy(session):
+            self.logger.warning("Pooled session crashed, relaunching")
+            self._quit(session)
+            self.recycled += 1
+            session = self._launch()
+        session.uses += 1
+        return session
+
+    def release(self, session):
+        """Reset a session and return it to the pool, recycling it if needed."""
+        if session.uses >= self.max_reuse:
+            self.logger.info(f"Session reached max reuse ({self.max_reuse}), recycling")
+            self._recycle(session)
+            return
+
+        if not self._reset(session):
+            self.logger.warning("Session unhealthy after test, recycling")
+            self._recycle(session)
+            return
+
+        self._idle.append(session)
+
+    def close(self):
+        """Quit every idle session."""
+        while self._idle:
+            self._quit(self._idle.pop())
+
+    def stats(self):
+        """Launch vs reset timings collected during the run."""
+        launches = len(self._launch_times)
+        resets = len(self._reset_times)
+        avg_launch = sum(self._launch_times) / launches if launches else 0.0
+        avg_reset = sum(self._reset_times) / resets if resets else 0.0
+        return {
+            "launches": launches,
+            "resets": resets,
+            "recycled": self.recycled,
+            "avg_launch_s": avg_launch,
+            "avg_reset_s": avg_reset,
+            "saved_s": resets * (avg_launch - avg_reset),
+        }
+
+    def _launch(self):
+        start_time = time.time()
+        session = PooledSession(self.factory())
+        self._launch_times.append(time.time() - start_time)
+        return session
+
+    def _recycle(self, session):
+        self._quit(session)
+        self.recycled += 1
+        if len(self._idle) < self.size:
+            self._idle.append(self._launch())
+
+    def _quit(self, session):
+        shutdown_screenshots(session.driver)
+        close_cdp_session(session.driver)
+        try:
+            session.driver.quit()
+        except WebDriverException:
+            pass
+
+    def _is_healthy(self, session):
+        try:
+            session.driver.current_url
+            return True
+        except WebDriverException:
+            return False
+
+    def _reset(self, session):
+        """Clear cookies, storage and cache, close extra tabs and go to about:blank."""
+        driver = session.driver
+        start_time = time.time()
+        try:
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+
+            # Report dismissals before their session storage is cleared
+            watchdog = get_overlay_watchdog(driver)
+            if watchdog:
+                watchdog.log_dismissals()
+            driver.delete_all_cookies()
+            driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            for origin in self._origins(driver.current_url):
+                driver.execute_cdp_cmd(
+                    "Storage.clearDataForOrigin",
+                    {"origin": origin, "storageTypes": "all"},
+                )
+            driver.get("about:blank")
+            get_network_monitor(driver).reset()
+        except WebDriverException as e:
+            self.logger.warning(f"Session reset failed: {e}")
+            return False
+
+        self._reset_times.append(time.time() - start_time)
+        return True
+
+    @staticmethod
+    def _origins(current_url):
+        origins = set()
+        for url in (Config.TWITCH_URL, current_url):
+            parsed = urlparse(url)
+            if parsed.scheme in ("http", "https"):
+                origins.add(f"{parsed.scheme}://{parsed.netloc}")
+        return origins
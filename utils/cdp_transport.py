@@ -0,0 +1,285 @@
+"""
+Direct Chrome DevTools transport.
+
+Keeps one persistent DevTools websocket per session and runs hot operations
+(script evaluation, DOM queries, input dispatch, screenshots) over it instead
+of one chromedriver HTTP request per command. Independent commands can be
+pipelined with call_many(). WebDriver stays the fallback for anything that
+needs WebElement handles.
+
+The websocket client is a minimal RFC 6455 implementation on the standard
+library so no extra dependency is needed.
+"""
+
+import base64
+import json
+import logging
+import os
+import socket
+import struct
+import threading
+import weakref
+from urllib.parse import urlsplit
+from urllib.request import urlopen
+from selenium.common.exceptions import JavascriptException, TimeoutException
+
+_sessions = weakref.WeakKeyDictionary()
+
+
+class WebSocket:
+    """Blocking text-frame websocket client"""
+
+    def __init__(self, url, timeout=30):
+        parts = urlsplit(url)
+        self.sock = socket.create_connection((parts.hostname, parts.port or 80), timeout)
+        self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        key = base64.b64encode(os.urandom(16)).decode()
+        path = parts.path + (f"?{parts.query}" if parts.query else "")
+        self.sock.sendall(
+            (
+                f"GET {path} HTTP/1.1\r\n"
+                f"Host: {parts.netloc}\r\n"
+                "Upgrade: websocket\r\n"
+                "Connection: Upgrade\r\n"
+                f"Sec-WebSocket-Key: {key}\r\n"
+                "Sec-WebSocket-Version: 13\r\n\r\n"
+            ).encode()
+        )
+        response = b""
+        while b"\r\n\r\n" not in response:
+            chunk = self.sock.recv(4096)
+            if not chunk:
+                raise ConnectionError("Websocket handshake failed")
+            response += chunk
+        head, self._buffer = response.split(b"\r\n\r\n", 1)
+        if b" 101 " not in head.split(b"\r\n", 1)[0]:
+            raise ConnectionError(f"Websocket upgrade refused: {head[:80]!r}")
+
+    def send(self, text):
+        self._send_frame(0x1, text.encode())
+
+    def recv(self):
+        """Next complete text message."""
+        message = b""
+        while True:
+            fin, opcode, payload = self._read_frame()
+            if opcode == 0x9:  # ping
+                self._send_frame(0xA, payload)
+                continue
+            if opcode == 0x8:
+                raise ConnectionError("Websocket closed by browser")
+            if opcode in (0x0, 0x1, 0x2):
+                message += payload
+                if fin:
+                    return message.decode()
+
+    def close(self):
+        try:
+            self._send_frame(0x8, b"")
+        except OSError:
+            pass
+        self.sock.close()
+
+    def _send_frame(self, opcode, payload):
+        length = len(payload)
+        header = bytes([0x80 | opcode])
+        if length < 126:
+            header += bytes([0x80 | length])
+        elif length < 1 << 16:
+            header += bytes([0x80 | 126]) + struct.pack(">H", length)
+        else:
+            header += bytes([0x80 | 127]) + struct.pack(">Q", length)
+        mask = os.urandom(4)
+        self.sock.sendall(header + mask + self._mask(payload, mask))
+
+    def _read_frame(self):
+        first, second = self._read(2)
+        length = second & 0x7F
+        if length == 126:
+            (length,) = struct.unpack(">H", self._read(2))
+        elif length == 127:
+            (length,) = struct.unpack(">Q", self._read(8))
+        mask = self._read(4) if second & 0x80 else None
+        payload = self._read(length)
+        if mask:
+            payload = self._mask(payload, mask)
+        return bool(first & 0x80), first & 0x0F, payload
+
+    def _read(self, size):
+        while len(self._buffer) < size:
+            chunk = self.sock.recv(max(65536, size - len(self._buffer)))
+            if not chunk:
+                raise ConnectionError("Websocket connection lost")
+            self._buffer += chunk
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+    @staticmethod
+    def _mask(data, mask):
+        if not data:
+            return data
+        repeated = (mask * (len(data) // 4 + 1))[: len(data)]
+        return (
+            int.from_bytes(data, "big") ^ int.from_bytes(repeated, "big")
+        ).to_bytes(len(data), "big")
+
+
+class CdpSession:
+    def __init__(self, driver, timeout=30):
+        self.driver = driver
+        self.timeout = timeout
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._id = 0
+        self._lock = threading.Lock()
+        self.ws = WebSocket(self._target_url(), timeout)
+
+    def _target_url(self):
+        """Websocket URL of the page target behind the current window handle."""
+        address = self.driver.capabilities["goog:chromeOptions"]["debuggerAddress"]
+        with urlopen(f"http://{address}/json", timeout=self.timeout) as response:
+            targets = json.load(response)
+        pages = [t for t in targets if t.get("type") == "page"]
+        handle = self.driver.current_window_handle
+        # chromedriver window handles are DevTools target ids
+        target = next((t for t in pages if t["id"] == handle), pages[0])
+        return target["webSocketDebuggerUrl"]
+
+    def call(self, method, params=None):
+        return self.call_many([(method, params)])[0]
+
+    def call_many(self, commands):
+        """
+        Pipeline independent commands: send all, then collect the results
+        in order. Raises JavascriptException on a protocol error.
+        """
+        with self._lock:
+            ids = []
+            for method, params in commands:
+                self._id += 1
+                ids.append(self._id)
+                self.ws.send(json.dumps({"id": self._id, "method": method, "params": params or {}}))
+
+            results = {}
+            while len(results) < len(ids):
+                try:
+                    message = json.loads(self.ws.recv())
+                except socket.timeout:
+                    # A frame may be half-read: start over on a fresh connection
+                    self.ws.close()
+                    self.ws = WebSocket(self._target_url(), self.timeout)
+                    raise TimeoutException(f"DevTools command timed out: {commands}")
+                if message.get("id") in ids:
+                    results[message["id"]] = message
+
+        out = []
+        for command_id, (method, _) in zip(ids, commands):
+            message = results[command_id]
+            if "error" in message:
+                raise JavascriptException(f"{method} failed: {message['error']}")
+            out.append(message["result"])
+        return out
+
+    def execute_script(self, script, *args):
+        """Equivalent of driver.execute_script for JSON-serializable args/results."""
+        return self._evaluate(self._function(script, args))
+
+    def execute_async_script(self, script, *args, timeout=None):
+        """Equivalent of driver.execute_async_script; the callback is the last argument."""
+        expression = (
+            "new Promise(resolve => { "
+            f"({self._wrap(script)}).apply(null, {json.dumps(list(args))}.concat([resolve])); "
+            "})"
+        )
+        if timeout is not None:
+            self.ws.sock.settimeout(timeout)
+        try:
+            return self._evaluate(expression, await_promise=True)
+        finally:
+            # After a timeout call_many has already swapped in a fresh connection
+            try:
+                self.ws.sock.settimeout(self.timeout)
+            except OSError:
+                pass
+
+    def evaluate_many(self, scripts):
+        """Pipeline several (script, args) evaluations in one batch."""
+        results = self.call_many(
+            [
+                ("Runtime.evaluate", self._evaluate_params(self._function(s, a)))
+                for s, a in scripts
+            ]
+        )
+        return [self._value(result) for result in results]
+
+    def count(self, selector):
+        return self.execute_script(
+            "return document.querySelectorAll(arguments[0]).length;", selector
+        )
+
+    def dispatch_click(self, x, y):
+        """Tap/click at viewport coordinates (pipelined press + release)."""
+        base = {"x": x, "y": y, "button": "left", "clickCount": 1}
+        self.call_many(
+            [
+                ("Input.dispatchMouseEvent", dict(base, type="mousePressed")),
+                ("Input.dispatchMouseEvent", dict(base, type="mouseReleased")),
+            ]
+        )
+
+    def insert_text(self, text):
+        self.call("Input.insertText", {"text": text})
+
+    def capture_screenshot(self, params=None):
+        return self.call("Page.captureScreenshot", params)["data"]
+
+    def close(self):
+        self.ws.close()
+
+    def _evaluate(self, expression, await_promise=False):
+        result = self.call("Runtime.evaluate", self._evaluate_params(expression, await_promise))
+        return self._value(result)
+
+    @staticmethod
+    def _evaluate_params(expression, await_promise=False):
+        return {
+            "expression": expression,
+            "returnByValue": True,
+            "awaitPromise": await_promise,
+            "userGesture": True,
+        }
+
+    @staticmethod
+    def _value(result):
+        if "exceptionDetails" in result:
+            details = result["exceptionDetails"]
+            text = details.get("exception", {}).get("description") or details.get("text")
+            raise JavascriptException(text)
+        return result["result"].get("value")
+
+    @classmethod
+    def _function(cls, script, args):
+        return f"({cls._wrap(script)}).apply(null, {json.dumps(list(args))})"
+
+    @staticmethod
+    def _wrap(script):
+        return f"function() {{ {script} \n}}"
+
+
+def open_cdp_session(driver):
+    """Open (once) the direct DevTools session for the driver."""
+    session = _sessions.get(driver)
+    if session is None:
+        session = CdpSession(driver)
+        _sessions[driver] = session
+    return session
+
+
+def get_cdp_session(driver):
+    """The driver's DevTools session, or None when WebDriver is the transport."""
+    return _sessions.get(driver)
+
+
+def close_cdp_session(driver):
+    session = _sessions.pop(driver, None)
+    if session is not None:
+        session.close()
@@ -0,0 +1,111 @@
+"""
+WebDriver command profiler.
+Counts every WebDriver command by type, calling page-object step and test,
+with its latency, and enforces per-step command budgets so N+1 round-trip
+regressions fail fast. Commands sent over the direct DevTools transport are
+not WebDriver round trips and are not counted.
+"""
+
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+from selenium.webdriver.remote.command import Command
+from utils.tracing import tracer
+
+# Commands that block while the page does the work (not round-trip overhead)
+BLOCKING_COMMANDS = (Command.W3C_EXECUTE_SCRIPT_ASYNC,)
+
+
+class CommandBudgetExceeded(AssertionError):
+    pass
+
+
+class CommandProfiler:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.stats = {}  # (test, caller, command) -> [count, total_s, max_s]
+        self.budgets = {}  # step method name -> max commands per call
+        self._instrumented = weakref.WeakSet()
+
+    def instrument(self, driver):
+        """Wrap driver.execute once so every command is recorded."""
+        if driver in self._instrumented:
+            return driver
+        original = driver.execute
+
+        def execute(driver_command, params=None):
+            start_time = time.perf_counter()
+            try:
+                result = original(driver_command, params)
+            except Exception:
+                self._record(driver_command, time.perf_counter() - start_time, enforce=False)
+                raise
+            self._record(driver_command, time.perf_counter() - start_time)
+            return result
+
+        driver.execute = execute
+        self._instrumented.add(driver)
+        return driver
+
+    def set_budgets(self, budgets):
+        self.budgets = dict(budgets)
+
+    @contextmanager
+    def budget(self, limit, label="block"):
+        """Fail if the wrapped block issues more than 'limit' commands."""
+        before = self.total(test=tracer.test)
+        yield
+        used = self.total(test=tracer.test) - before
+        if used > limit:
+            raise CommandBudgetExceeded(
+                f"{label} used {used} WebDriver commands (budget {limit})"
+            )
+
+    def total(self, test=None, caller=None, command=None):
+        with self._lock:
+            return sum(
+                count
+                for (t, c, cmd), (count, _, _) in self.stats.items()
+                if (test is None or t == test)
+                and (caller is None or c == caller)
+                and (command is None or cmd == command)
+            )
+
+    def by(self, field, test=None):
+        """{value: [count, total_s]} grouped by 'test', 'caller' or 'command'."""
+        index = {"test": 0, "caller": 1, "command": 2}[field]
+        grouped = {}
+        with self._lock:
+            for key, (count, total, _) in self.stats.items():
+                if test is not None and key[0] != test:
+                    continue
+                row = grouped.setdefault(key[index], [0, 0.0])
+                row[0] += count
+                row[1] += total
+        return grouped
+
+    def _record(self, command, elapsed, enforce=True):
+        tracer.record_command(elapsed, blocking=command in BLOCKING_COMMANDS)
+        stack = tracer.current_stack()
+        caller = stack[-1]["name"] if stack else "<test>"
+        key = (tracer.test, caller, command)
+        with self._lock:
+            row = self.stats.setdefault(key, [0, 0.0, 0.0])
+            row[0] += 1
+            row[1] += elapsed
+            row[2] = max(row[2], elapsed)
+
+        # Inclusive count on every open step; enforce budgets as we go
+        for span in stack:
+            span["commands"] = span.get("commands", 0) + 1
+            step = span["name"].rsplit(".", 1)[-1]
+            limit = self.budgets.get(step)
+            if enforce and limit is not None and span["commands"] > limit:
+                raise CommandBudgetExceeded(
+                    f"{step} exceeded its budget of {limit} WebDriver commands "
+                    f"(last: {command})"
+                )
+
+
+profiler = CommandProfiler()
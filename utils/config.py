@@ -3,27 +3,154 @@ Configuration file for test framework.
 Contains all hardcoded values: URLs, timeouts, device settings, etc.
 """
 
+import os
+
 
 class Config:
     """Base configuration"""
 
     # URLs
     TWITCH_URL = "https://m.twitch.tv/"
+    STARCRAFT_DIRECTORY_URL = "https://m.twitch.tv/directory/category/starcraft-ii"
 
     # Mobile device
-    MOBILE_DEVICE = "iPhone 14 Pro Max"
+    DEVICE_ENV = "TWITCH_MOBILE_DEVICE"
+    MOBILE_DEVICE = os.environ.get(DEVICE_ENV, "iPhone 14 Pro Max")
+    DEVICE_PROFILES = ["iPhone 14 Pro Max", "Pixel 7"]
 
     # Browser preferences
     NOTIFICATION_SETTING = 2  # Block notifications
 
+    WINDOW_SIZE = (400, 1100)
+
+    # Driver cache
+    DRIVER_CACHE_DIR = os.path.join(
+        os.path.expanduser("~"), ".cache", "twitch-automation", "chromedriver"
+    )
+
+    # Transport for hot BasePage operations: webdriver | cdp
+    TRANSPORT = os.environ.get("TWITCH_TRANSPORT", "webdriver")
+
+    # Browser pool
+    POOL_SIZE = 1
+    POOL_MAX_REUSE = 50
+
     # Test data
     STARCRAFT_SEARCH_TERM = "StarCraft II"
 
+    # Network idle: long-lived or background requests that never "finish"
+    NETWORK_IDLE_IGNORE = [
+        r"^wss?://",
+        r"\.m3u8(\?|$)",
+        r"\.ts(\?|$)",
+        r"video-edge|usher\.ttvnw\.net|video-weaver",
+        r"spade\.twitch\.tv|countess\.twitch\.tv",
+        r"google-analytics|googletagmanager|doubleclick|scorecardresearch|amazon-adsystem",
+    ]
+
+    # Fast mode: resource classes blocked via Network.setBlockedURLs
+    FAST_MODE_ENABLED = os.environ.get("TWITCH_FAST_MODE", "0") == "1"
+    FAST_MODE_BLOCK = ["media", "trackers", "ads", "images"]
+    FAST_MODE_CLASSES = {
+        "media": [
+            "*.m3u8*",
+            "*.ts",
+            "*.ts?*",
+            "*.mp4*",
+            "*video-edge*",
+            "*usher.ttvnw.net*",
+        ],
+        "trackers": [
+            "*spade.twitch.tv*",
+            "*countess.twitch.tv*",
+            "*google-analytics.com*",
+            "*googletagmanager.com*",
+            "*scorecardresearch.com*",
+            "*comscore.com*",
+        ],
+        "ads": [
+            "*doubleclick.net*",
+            "*amazon-adsystem.com*",
+            "*imasdk.googleapis.com*",
+        ],
+        # Stream preview thumbnails and profile banners (card links stay intact)
+        "images": [
+            "*static-cdn.jtvnw.net/previews-ttv/*",
+            "*static-cdn.jtvnw.net/jtv_user_pictures/*profile_banner*",
+        ],
+    }
+
+    # Record/replay archive: live | record | replay
+    NETWORK_MODE = os.environ.get("TWITCH_NETWORK_MODE", "live")
+    ARCHIVE_PATH = os.environ.get("TWITCH_ARCHIVE", os.path.join("archives", "search_flow.har.json"))
+    NETWORK_PROFILE = os.environ.get("TWITCH_NETWORK_PROFILE", "none")
+    NETWORK_PROFILES = {
+        # name: (latency seconds, bandwidth bytes/second, 0 = unlimited)
+        "none": (0, 0),
+        "4g": (0.05, 1_500_000),
+        "3g": (0.15, 200_000),
+    }
+
+    # Adaptive waits: timeouts/polling derived from recorded latencies
+    ADAPTIVE_WAITS = True
+    LATENCY_STATS_FILE = ".latency_stats.json"
+    ADAPTIVE_MARGIN = 1.5
+    ADAPTIVE_MIN_SAMPLES = 5
+    ADAPTIVE_MAX_SAMPLES = 200
+    ADAPTIVE_MIN_TIMEOUT = 0.5
+    ADAPTIVE_ABSENT_TIMEOUT = 1.5
+
+    # Dismiss known overlays (cookie banner, mature gate) in the background
+    OVERLAY_WATCHDOG = True
+
+    # Browser state snapshots (consent/onboarding already done)
+    STATE_SNAPSHOT = True
+    STATE_SNAPSHOT_VERSION = 1  # bump when consent/onboarding flow changes
+    STATE_SNAPSHOT_MAX_AGE = 7 * 24 * 3600
+    STATE_SNAPSHOT_DIR = os.path.join(
+        os.path.expanduser("~"), ".cache", "twitch-automation", "state"
+    )
+    STATE_SNAPSHOT_SEED_PATH = "/robots.txt"  # cheap same-origin page for storage
+
+    # Directory crawler
+    CRAWLER_MAX_SEEN = 5000  # hrefs remembered for de-duplication
+    CRAWLER_MAX_IDLE_SCROLLS = 2  # scrolls without new cards before end of list
+
+    # Flow step retries from the last checkpoint
+    FLOW_STEP_RETRIES = 2
+
+    # Playback probe
+    PLAYBACK_PROBE_WINDOW = 5  # seconds sampled on the streamer page
+
+    # Artifacts / parallel runs
+    ARTIFACTS_DIR = "artifacts"
+    WORKER_ID_ENV = "TWITCH_WORKER_ID"
+    DURATIONS_FILE = ".test_durations.json"
+    RUN_ID_ENV = "TWITCH_RUN_ID"
+    VITALS_FILE = os.path.join(ARTIFACTS_DIR, "web_vitals.jsonl")
+
+    # Screenshot capture
+    SCREENSHOT_FORMAT = os.environ.get("TWITCH_SCREENSHOT_FORMAT", "webp")  # png | jpeg | webp
+    SCREENSHOT_QUALITY = 80  # jpeg/webp only
+    SCREENSHOT_WORKERS = 2
+    SCREENSHOT_QUEUE_SIZE = 8
+    SCREENSHOT_ON_FAILURE_ONLY = os.environ.get("TWITCH_SCREENSHOTS_ON_FAILURE", "0") == "1"
+
+    # Content-addressed artifact store
+    ARTIFACT_STORE_DIR = os.environ.get(
+        "TWITCH_ARTIFACT_STORE", os.path.join(ARTIFACTS_DIR, "store")
+    )
+    ARTIFACT_STORE_MAX_BYTES = int(os.environ.get("TWITCH_ARTIFACT_STORE_MB", "500")) * 1024 * 1024
+    ARTIFACT_PHASH_DISTANCE = 4  # max differing dHash bits for a near-duplicate
+    ARTIFACT_LUMA_DELTA = 8  # max mean brightness difference (0-255) for a near-duplicate
+
     # Screenshot names
     SCREENSHOT_HOME = "01_home_page.png"
     SCREENSHOT_BEFORE_SCROLL = "03_before_scroll.png"
     SCREENSHOT_AFTER_SCROLL = "04_after_scroll_{}.png"
     SCREENSHOT_STREAMER = "05_streamer_selected.png"
+    SCREENSHOT_POPUP_STUCK = "popup_stuck.png"
+    SCREENSHOT_FAILURE_PREFIX = "FAILED_"
 
 
 class LocatorSelectors:
@@ -75,5 +202,13 @@ class Messages:
     MATURE_POPUP_HANDLED = "✓ Mature content popup handled successfully"
     MATURE_POPUP_NOT_PRESENT = "Mature content popup not present"
 
+    # Playback
+    VIDEO_NOT_FOUND = "No <video> element found on streamer page"
+    PLAYBACK_TTFF_SLOW = "Time to first frame {:.0f}ms exceeds {:.0f}ms"
+    PLAYBACK_STALLS = "Playback stalled {} times (max {})"
+    PLAYBACK_DROPPED_FRAMES = "Dropped frame ratio {:.3f} exceeds {:.3f}"
+    PLAYBACK_RESOLUTION_LOW = "Playback height {}p below {}p"
+
     # Dom
     STABLE_DOM = "✓ DOM stable"
+    DOM_NOT_STABLE = "DOM did not stabilize within {}s"
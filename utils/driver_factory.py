@@ -0,0 +1,54 @@
+"""
+Chrome driver construction.
+Builds mobile-emulated Chrome sessions shared by fixtures and the browser pool.
+"""
+
+import logging
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from utils.config import Config
+from utils.driver_resolver import resolve_chromedriver
+
+logger = logging.getLogger(__name__)
+
+
+def build_chrome_options(proxy=None):
+    """Chrome options with Mobile Emulation enabled."""
+    mobile_emulation = {"deviceName": Config.MOBILE_DEVICE}
+
+    options = webdriver.ChromeOptions()
+    options.add_experimental_option("mobileEmulation", mobile_emulation)
+
+    # Block notifications
+    prefs = {
+        "profile.default_content_setting_values.notifications": Config.NOTIFICATION_SETTING
+    }
+    options.add_experimental_option("prefs", prefs)
+    options.add_experimental_option("excludeSwitches", ["enable-logging"])
+
+    # DevTools Network events for NetworkMonitor
+    options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+
+    # Record/replay archive proxy
+    if proxy:
+        options.add_argument(f"--proxy-server=http://{proxy}")
+        options.add_argument("--proxy-bypass-list=<-loopback>")
+        options.add_argument("--ignore-certificate-errors")
+    return options
+
+
+def create_driver(proxy=None):
+    """Initializes Chrome with Mobile Emulation enabled."""
+    options = build_chrome_options(proxy)
+
+    try:
+        driver_path = resolve_chromedriver()
+        service = Service(driver_path) if driver_path else Service()
+        driver = webdriver.Chrome(service=service, options=options)
+    except Exception as e:
+        logger.warning(f"Cached chromedriver failed: {e}")
+        logger.warning("Attempting to use system ChromeDriver...")
+        driver = webdriver.Chrome(options=options)
+
+    driver.set_window_size(*Config.WINDOW_SIZE)
+    return driver
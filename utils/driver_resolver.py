@@ -0,0 +1,153 @@
+"""
+Offline, disk-cached chromedriver resolution.
+Matches the installed Chrome major version to a cached chromedriver binary and
+only falls back to webdriver-manager (network) when nothing is cached yet.
+"""
+
+import functools
+import json
+import logging
+import os
+import platform
+import re
+import shutil
+import subprocess
+import time
+from utils.config import Config
+from utils.file_io import FileLock, write_json_atomic
+
+logger = logging.getLogger(__name__)
+
+CHROMEDRIVER_NAME = "chromedriver.exe" if os.name == "nt" else "chromedriver"
+
+CHROME_CANDIDATES = {
+    "Linux": [
+        "google-chrome",
+        "google-chrome-stable",
+        "chromium",
+        "chromium-browser",
+    ],
+    "Darwin": [
+        "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+        "/Applications/Chromium.app/Contents/MacOS/Chromium",
+    ],
+    "Windows": [
+        r"C:\Program Files\Google\Chrome\Application\chrome.exe",
+        r"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe",
+        os.path.expandvars(r"%LOCALAPPDATA%\Google\Chrome\Application\chrome.exe"),
+    ],
+}
+
+
+def find_chrome_binary():
+    """Path of the installed Chrome binary, or None."""
+    for candidate in CHROME_CANDIDATES.get(platform.system(), []):
+        path = shutil.which(candidate) or (candidate if os.path.isfile(candidate) else None)
+        if path:
+            return os.path.realpath(path)
+    return None
+
+
+def detect_chrome_version(binary):
+    """Full Chrome version string for the given binary, or None."""
+    if os.name == "nt":
+        # Windows installs keep a version-named folder next to chrome.exe
+        folder = os.path.dirname(binary)
+        for entry in os.listdir(folder):
+            if re.match(r"^\d+\.\d+\.\d+\.\d+$", entry):
+                return entry
+        return None
+
+    try:
+        output = subprocess.run(
+            [binary, "--version"], capture_output=True, text=True, timeout=10
+        ).stdout
+    except (OSError, subprocess.SubprocessError):
+        return None
+    match = re.search(r"(\d+\.\d+\.\d+\.\d+)", output)
+    return match.group(1) if match else None
+
+
+class DriverResolver:
+    def __init__(self, cache_dir=None):
+        self.cache_dir = cache_dir or Config.DRIVER_CACHE_DIR
+        self.index_path = os.path.join(self.cache_dir, "index.json")
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def resolve(self):
+        """
+        Path to a chromedriver matching the installed Chrome, or None to let
+        Selenium use the system chromedriver.
+        """
+        start_time = time.time()
+        major = self.chrome_major_version()
+        if major is None:
+            self.logger.warning("Chrome version not detected, using system ChromeDriver")
+            return None
+
+        driver_path = self._cached_driver(major)
+        if not os.path.isfile(driver_path):
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with FileLock(os.path.join(self.cache_dir, f"{major}.lock")):
+                # Another worker may have finished the download while we waited
+                if not os.path.isfile(driver_path):
+                    if not self._download(major, driver_path):
+                        return None
+
+        self.logger.info(
+            f"✓ chromedriver {major} resolved in {(time.time() - start_time) * 1000:.1f}ms"
+        )
+        return driver_path
+
+    def chrome_major_version(self):
+        """Chrome major version, cached on disk by binary path and mtime."""
+        binary = find_chrome_binary()
+        if binary is None:
+            return None
+
+        key = f"{binary}:{os.path.getmtime(binary)}"
+        index = self._read_index()
+        version = index.get(key)
+        if version is None:
+            version = detect_chrome_version(binary)
+            if version is None:
+                return None
+            index[key] = version
+            self._write_index(index)
+        return version.split(".")[0]
+
+    def _cached_driver(self, major):
+        return os.path.join(self.cache_dir, major, CHROMEDRIVER_NAME)
+
+    def _download(self, major, driver_path):
+        try:
+            from webdriver_manager.chrome import ChromeDriverManager
+
+            downloaded = ChromeDriverManager().install()
+        except Exception as e:
+            self.logger.warning(f"chromedriver {major} not cached and download failed: {e}")
+            return False
+
+        os.makedirs(os.path.dirname(driver_path), exist_ok=True)
+        tmp_path = f"{driver_path}.{os.getpid()}.tmp"
+        shutil.copy2(downloaded, tmp_path)
+        os.chmod(tmp_path, 0o755)
+        os.replace(tmp_path, driver_path)
+        self.logger.info(f"✓ Cached chromedriver {major} at {driver_path}")
+        return True
+
+    def _read_index(self):
+        try:
+            with open(self.index_path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _write_index(self, index):
+        write_json_atomic(self.index_path, index)
+
+
+@functools.lru_cache(maxsize=None)
+def resolve_chromedriver():
+    """Resolve chromedriver once per process."""
+    return DriverResolver().resolve()
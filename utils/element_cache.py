@@ -0,0 +1,66 @@
+"""
+Per-page WebElement cache keyed by locator.
+Cached handles are revalidated with one script call that also reports the
+current URL, so client-side route changes invalidate the cache too.
+"""
+
+from selenium.common.exceptions import StaleElementReferenceException
+
+
+class ElementCache:
+    def __init__(self, driver):
+        self.driver = driver
+        self.hits = 0
+        self.misses = 0
+        self._elements = {}
+        self._url = None
+
+    def get(self, locator, resolve):
+        """
+        Cached element for 'locator' if still attached and visible on the
+        same URL, otherwise 'resolve(locator)' and cache the result.
+        """
+        element = self._elements.get(locator)
+        if element is not None and self._is_valid(element):
+            self.hits += 1
+            return element
+
+        self.misses += 1
+        element = resolve(locator)
+        self._elements[locator] = element
+        if self._url is None:
+            self._url = self.driver.current_url
+        return element
+
+    def invalidate(self):
+        self._elements.clear()
+        self._url = None
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+    def _is_valid(self, element):
+        try:
+            url, usable = self.driver.execute_script(
+                """
+            const el = arguments[0];
+            const rect = el.getBoundingClientRect();
+            return [location.href, el.isConnected && rect.width > 0 && rect.height > 0];
+            """,
+                element,
+            )
+        except StaleElementReferenceException:
+            self.invalidate()
+            return False
+
+        if url != self._url:
+            # Client-side navigation: every cached handle is suspect
+            self.invalidate()
+            self._url = url
+            return False
+        return usable
@@ -0,0 +1,48 @@
+"""
+Resource-blocking fast mode.
+Blocks resource classes and URL patterns the flows never check (video
+segments, trackers, large thumbnails) via CDP Network.setBlockedURLs.
+"""
+
+import logging
+import weakref
+from utils.config import Config
+
+logger = logging.getLogger(__name__)
+
+_active = weakref.WeakKeyDictionary()
+
+
+def blocked_patterns(block=None, allow=(), extra=()):
+    """URL patterns for the requested resource classes minus the allowed ones."""
+    classes = Config.FAST_MODE_BLOCK if block is None else block
+    patterns = []
+    for name in classes:
+        if name in allow:
+            continue
+        patterns.extend(Config.FAST_MODE_CLASSES[name])
+    patterns.extend(extra)
+    return patterns
+
+
+def apply_fast_mode(driver, enabled=None, block=None, allow=(), extra=()):
+    """
+    Install (or clear) URL blocking on the session.
+    Returns the active pattern list (empty when disabled).
+    """
+    if enabled is None:
+        enabled = Config.FAST_MODE_ENABLED
+    patterns = blocked_patterns(block, allow, extra) if enabled else []
+
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+    _active[driver] = patterns
+
+    if patterns:
+        logger.info(f"Fast mode on: blocking {len(patterns)} URL patterns")
+    return patterns
+
+
+def active_patterns(driver):
+    """Patterns currently blocked on the session."""
+    return _active.get(driver, [])
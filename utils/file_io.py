@@ -0,0 +1,58 @@
+"""
+Small file helpers shared by the on-disk caches.
+Safe for several pytest workers writing the same files concurrently.
+"""
+
+import json
+import os
+import time
+
+
+class FileLock:
+    """
+    Cross-process lock based on an exclusively created lock file.
+    A lock older than 'stale_after' (left by a crashed holder) is taken over,
+    so it must stay below 'timeout'.
+    """
+
+    def __init__(self, path, timeout=180, stale_after=120):
+        self.path = path
+        self.timeout = timeout
+        self.stale_after = stale_after
+        self._fd = None
+
+    def __enter__(self):
+        deadline = time.time() + self.timeout
+        while True:
+            try:
+                self._fd = os.open(self.path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                os.write(self._fd, str(os.getpid()).encode())
+                return self
+            except FileExistsError:
+                self._remove_if_stale()
+                if time.time() > deadline:
+                    raise TimeoutError(f"Could not acquire lock: {self.path}")
+                time.sleep(0.1)
+
+    def __exit__(self, *exc):
+        os.close(self._fd)
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+    def _remove_if_stale(self):
+        try:
+            if time.time() - os.path.getmtime(self.path) > self.stale_after:
+                os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+
+def write_json_atomic(path, data, **dump_kwargs):
+    """Write JSON to a per-process temp file and rename it over 'path'."""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, **dump_kwargs)
+    os.replace(tmp_path, path)
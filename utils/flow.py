@@ -0,0 +1,164 @@
+"""
+Step-level checkpoints and retries for page flows.
+
+A flow is a list of named steps. Before a checkpointed step runs, the URL,
+scroll offset, cookies and web storage are captured. When a step fails with a
+flaky WebDriver error (stale element, intercepted click, timeout) the browser
+is restored to the last checkpoint and only the steps from there on
+are rerun, instead of the whole test. Assertion failures are product
+failures and are never retried.
+"""
+
+import copy
+import logging
+import time
+from selenium.common.exceptions import (
+    ElementClickInterceptedException,
+    StaleElementReferenceException,
+    TimeoutException,
+)
+from utils.config import Config
+from utils.state_snapshot import cdp_cookie, origin_of, seed_storage
+
+RETRYABLE = (
+    StaleElementReferenceException,
+    ElementClickInterceptedException,
+    TimeoutException,
+)
+
+# Flow reports of the whole run, for the pytest summary
+flow_reports = []
+
+
+class Checkpoint:
+    """Browser state captured before a step"""
+
+    def __init__(self, index, state, context):
+        self.index = index
+        self.state = state
+        self.context = context
+
+
+class Flow:
+    def __init__(self, page, name, retries=None):
+        self.page = page
+        self.driver = page.driver
+        self.name = name
+        self.retries = Config.FLOW_STEP_RETRIES if retries is None else retries
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.steps = []
+        self.context = {}
+        self.report = {
+            "flow": name,
+            "steps": {},
+            "retries": 0,
+            "restore_s": 0.0,
+            "saved_s": 0.0,
+        }
+
+    def step(self, name, checkpoint=True):
+        """Decorator registering fn(context) as the next step of the flow."""
+
+        def register(fn):
+            self.steps.append((name, fn, checkpoint))
+            return fn
+
+        return register
+
+    def run(self):
+        """Run all steps, retrying failed ones from their last checkpoint."""
+        checkpoints = []
+        durations = [0.0] * len(self.steps)
+        attempts_left = self.retries
+        index = 0
+
+        while index < len(self.steps):
+            current = index
+            name, fn, wants_checkpoint = self.steps[current]
+            if wants_checkpoint and not any(c.index == current for c in checkpoints):
+                checkpoints.append(self._capture(current))
+
+            start_time = time.time()
+            try:
+                fn(self.context)
+            except RETRYABLE as e:
+                if attempts_left <= 0 or not checkpoints:
+                    raise
+                attempts_left -= 1
+                checkpoint = checkpoints[-1]
+                self.logger.warning(
+                    f"Step '{name}' failed ({type(e).__name__}), retrying from checkpoint "
+                    f"'{self.steps[checkpoint.index][0]}'"
+                )
+                self._restore(checkpoint)
+                self.report["retries"] += 1
+                # A full rerun would have repeated every step before the checkpoint
+                self.report["saved_s"] += sum(durations[: checkpoint.index])
+                index = checkpoint.index
+                continue
+            finally:
+                durations[current] = time.time() - start_time
+                entry = self.report["steps"].setdefault(name, {"attempts": 0, "duration_s": 0.0})
+                entry["attempts"] += 1
+                entry["duration_s"] += durations[current]
+
+            index += 1
+
+        self.report["saved_s"] = max(0.0, self.report["saved_s"] - self.report["restore_s"])
+        flow_reports.append(self.report)
+        if self.report["retries"]:
+            self.logger.info(
+                f"✓ Flow '{self.name}' passed after {self.report['retries']} step retries, "
+                f"~{self.report['saved_s']:.1f}s saved vs full rerun"
+            )
+        return self.context
+
+    def _capture(self, index):
+        state = self.page.run_script(
+            """
+            const dump = name => {
+                try { return Object.assign({}, window[name]); } catch (e) { return {}; }
+            };
+            return {
+                url: location.href,
+                scroll_y: window.scrollY,
+                local: dump('localStorage'),
+                session: dump('sessionStorage'),
+            };
+            """
+        )
+        state["cookies"] = self.driver.get_cookies()
+        return Checkpoint(index, state, copy.copy(self.context))
+
+    def _restore(self, checkpoint):
+        start_time = time.time()
+        state = checkpoint.state
+
+        if self.page.element_cache:
+            self.page.element_cache.invalidate()
+
+        # Drop state added after the checkpoint
+        self.driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        self.page.run_script(
+            "try { localStorage.clear(); sessionStorage.clear(); } catch (e) {}"
+        )
+
+        if state["url"].startswith("http"):
+            self.driver.execute_cdp_cmd(
+                "Network.setCookies",
+                {"cookies": [cdp_cookie(c) for c in state["cookies"]]},
+            )
+            # Storage must be in place before the app boots, as in restore_snapshot
+            seed_storage(
+                self.driver, origin_of(state["url"]), state["local"], state["session"]
+            )
+            self.driver.get(state["url"])
+            self.page.wait_for_page_to_load()
+            self.page.run_script("window.scrollTo(0, arguments[0]);", state["scroll_y"])
+        else:
+            # Checkpoint taken before the first navigation
+            self.driver.get(state["url"])
+
+        self.context.clear()
+        self.context.update(copy.copy(checkpoint.context))
+        self.report["restore_s"] += time.time() - start_time
@@ -0,0 +1,283 @@
+"""
+Record/replay HTTP archive.
+
+In record mode a local MITM proxy forwards every request to the real site and
+stores the responses in a HAR-like JSON archive. In replay mode the same proxy
+serves responses from the archive only, with optional simulated latency and
+bandwidth, so flows run offline and deterministically.
+
+Chrome is pointed at the proxy with --proxy-server and accepts its
+self-signed certificate via --ignore-certificate-errors. Websocket traffic
+is not recorded.
+"""
+
+import base64
+import hashlib
+import json
+import logging
+import os
+import ssl
+import subprocess
+import threading
+import time
+from http.client import HTTPConnection, HTTPSConnection
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+from utils.config import Config
+
+HOP_BY_HOP = {
+    "connection",
+    "keep-alive",
+    "proxy-authenticate",
+    "proxy-authorization",
+    "proxy-connection",
+    "te",
+    "trailers",
+    "transfer-encoding",
+    "upgrade",
+    "content-length",
+}
+
+
+class HttpArchive:
+    """Responses keyed by method, URL and request body hash"""
+
+    def __init__(self, path):
+        self.path = path
+        self.entries = {}
+        self._cursor = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def digest(body):
+        return hashlib.sha1(body).hexdigest()[:12] if body else "-"
+
+    @classmethod
+    def key(cls, method, url, body=b""):
+        return f"{method} {url} {cls.digest(body)}"
+
+    def add(self, method, url, body, status, headers, content):
+        entry = {
+            "request": {"method": method, "url": url, "bodyHash": self.digest(body)},
+            "response": {
+                "status": status,
+                "headers": [{"name": k, "value": v} for k, v in headers],
+                "content": {"encoding": "base64", "text": base64.b64encode(content).decode()},
+            },
+        }
+        with self._lock:
+            self.entries.setdefault(self.key(method, url, body), []).append(entry)
+
+    def lookup(self, method, url, body=b""):
+        """
+        Recorded response for the request. Repeated requests cycle through
+        the recorded responses in order; falls back to ignoring the body.
+        """
+        with self._lock:
+            key = self.key(method, url, body)
+            if key not in self.entries:
+                prefix = f"{method} {url} "
+                key = next((k for k in self.entries if k.startswith(prefix)), None)
+                if key is None:
+                    return None
+            responses = self.entries[key]
+            index = self._cursor.get(key, 0)
+            self._cursor[key] = index + 1
+            response = responses[index % len(responses)]["response"]
+
+        headers = [(h["name"], h["value"]) for h in response["headers"]]
+        content = base64.b64decode(response["content"]["text"])
+        return response["status"], headers, content
+
+    def load(self):
+        with open(self.path, encoding="utf-8") as f:
+            log = json.load(f)["log"]
+        for entry in log["entries"]:
+            request = entry["request"]
+            key = f"{request['method']} {request['url']} {request['bodyHash']}"
+            self.entries.setdefault(key, []).append(entry)
+        return self
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        entries = [entry for group in self.entries.values() for entry in group]
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump({"log": {"version": "1.2", "entries": entries}}, f)
+
+
+class ArchiveProxyHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    tunnel_host = None
+
+    def log_message(self, format, *args):
+        self.server.logger.debug(format % args)
+
+    def do_CONNECT(self):
+        self.send_response(200, "Connection Established")
+        self.end_headers()
+        try:
+            connection = self.server.tls_context.wrap_socket(
+                self.connection, server_side=True
+            )
+        except (ssl.SSLError, OSError):
+            self.close_connection = True
+            return
+
+        self.tunnel_host = self.path
+        self.connection = connection
+        self.rfile = connection.makefile("rb", self.rbufsize)
+        self.wfile = connection.makefile("wb", 0)
+        self.close_connection = False
+        try:
+            while not self.close_connection:
+                self.handle_one_request()
+        except (ssl.SSLError, ConnectionError):
+            pass
+        self.close_connection = True
+
+    def do_GET(self):
+        self._serve()
+
+    do_POST = do_PUT = do_PATCH = do_DELETE = do_HEAD = do_OPTIONS = do_GET
+
+    def _url(self):
+        if self.path.startswith("http://") or self.path.startswith("https://"):
+            return self.path
+        host = self.tunnel_host
+        if host.endswith(":443"):
+            host = host[: -len(":443")]
+        return f"https://{host}{self.path}"
+
+    def _serve(self):
+        length = int(self.headers.get("Content-Length", 0))
+        body = self.rfile.read(length) if length else b""
+        url = self._url()
+        archive = self.server.archive
+
+        if self.server.mode == "record":
+            try:
+                status, headers, content = self._forward(url, body)
+            except OSError as e:
+                self.server.logger.warning(f"Upstream failed for {url}: {e}")
+                status, headers, content = 502, [], b""
+            else:
+                archive.add(self.command, url, body, status, headers, content)
+        else:
+            recorded = archive.lookup(self.command, url, body)
+            if recorded is None:
+                self.server.misses += 1
+                self.server.logger.debug(f"Not in archive: {self.command} {url}")
+                status, headers, content = 404, [], b""
+            else:
+                self.server.hits += 1
+                status, headers, content = recorded
+
+        self._respond(status, headers, content)
+
+    def _forward(self, url, body):
+        parts = urlsplit(url)
+        if parts.scheme == "https":
+            upstream = HTTPSConnection(
+                parts.netloc, timeout=30, context=ssl.create_default_context()
+            )
+        else:
+            upstream = HTTPConnection(parts.netloc, timeout=30)
+        path = parts.path or "/"
+        if parts.query:
+            path = f"{path}?{parts.query}"
+        headers = {k: v for k, v in self.headers.items() if k.lower() not in HOP_BY_HOP}
+        try:
+            upstream.request(self.command, path, body or None, headers)
+            response = upstream.getresponse()
+            content = response.read()
+            return response.status, response.getheaders(), content
+        finally:
+            upstream.close()
+
+    def _respond(self, status, headers, content):
+        latency, bandwidth = self.server.profile
+        if latency:
+            time.sleep(latency)
+
+        self.send_response(status)
+        for name, value in headers:
+            if name.lower() not in HOP_BY_HOP:
+                self.send_header(name, value)
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        if self.command == "HEAD":
+            return
+
+        chunk_size = 16 * 1024
+        for offset in range(0, len(content), chunk_size):
+            chunk = content[offset : offset + chunk_size]
+            self.wfile.write(chunk)
+            if bandwidth:
+                time.sleep(len(chunk) / bandwidth)
+
+
+class ArchiveProxy(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, archive, mode="replay", profile=None):
+        super().__init__(("127.0.0.1", 0), ArchiveProxyHandler)
+        self.archive = archive
+        self.mode = mode
+        self.profile = Config.NETWORK_PROFILES[profile or Config.NETWORK_PROFILE]
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.hits = 0
+        self.misses = 0
+
+        self.tls_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        self.tls_context.load_cert_chain(*ensure_certificate())
+        self._thread = None
+
+    @property
+    def address(self):
+        host, port = self.server_address[:2]
+        return f"{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        self.logger.info(f"✓ Archive proxy ({self.mode}) listening on {self.address}")
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+        if self.mode == "record":
+            self.archive.save()
+            self.logger.info(f"✓ Archive saved: {self.archive.path}")
+        else:
+            self.logger.info(f"Archive replay: {self.hits} hits, {self.misses} misses")
+
+
+def ensure_certificate():
+    """Self-signed certificate for the proxy, generated once with openssl."""
+    cert_dir = os.path.join(os.path.dirname(Config.DRIVER_CACHE_DIR), "proxy-cert")
+    cert = os.path.join(cert_dir, "cert.pem")
+    key = os.path.join(cert_dir, "key.pem")
+    if not (os.path.isfile(cert) and os.path.isfile(key)):
+        os.makedirs(cert_dir, exist_ok=True)
+        subprocess.run(
+            [
+                "openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes",
+                "-keyout", key, "-out", cert, "-days", "3650",
+                "-subj", "/CN=twitch-archive-proxy",
+            ],
+            check=True,
+            capture_output=True,
+        )
+    return cert, key
+
+
+def start_archive_proxy(mode=None, path=None, profile=None):
+    """Start the proxy for 'record' or 'replay'; returns None in 'live' mode."""
+    mode = mode or Config.NETWORK_MODE
+    if mode == "live":
+        return None
+    archive = HttpArchive(path or Config.ARCHIVE_PATH)
+    if mode == "replay":
+        archive.load()
+    return ArchiveProxy(archive, mode, profile).start()
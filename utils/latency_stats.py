@@ -0,0 +1,91 @@
+"""
+Persistent wait-latency statistics keyed by page and locator.
+Waits derive their timeout (p99 x margin) and poll interval from how long
+the same wait actually took in earlier runs.
+"""
+
+import json
+import os
+import threading
+from utils.config import Config
+from utils.file_io import FileLock, write_json_atomic
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class LatencyStats:
+    def __init__(self, path=None):
+        self.path = path or Config.LATENCY_STATS_FILE
+        self.samples = {}  # key -> [[seconds, found], ...]
+        self._new = {}
+        self._lock = threading.Lock()
+
+    def load(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                self.samples = json.load(f)
+        except (OSError, ValueError):
+            self.samples = {}
+        return self
+
+    def record(self, key, seconds, found):
+        sample = [round(seconds, 4), found]
+        with self._lock:
+            for store in (self.samples, self._new):
+                history = store.setdefault(key, [])
+                history.append(sample)
+                del history[: -Config.ADAPTIVE_MAX_SAMPLES]
+
+    def found_ratio(self, key):
+        history = self.samples.get(key, [])
+        if not history:
+            return None
+        return sum(1 for _, found in history if found) / len(history)
+
+    def timeout_for(self, key, default):
+        """p99 of successful waits x margin, clamped to [min, default]."""
+        history = self.samples.get(key, [])
+        if len(history) < Config.ADAPTIVE_MIN_SAMPLES:
+            return default
+
+        found = [seconds for seconds, ok in history if ok]
+        if not found:
+            # Never appeared in recent runs (e.g. a missing popup): check briefly
+            return min(default, Config.ADAPTIVE_ABSENT_TIMEOUT)
+        timeout = percentile(found, 0.99) * Config.ADAPTIVE_MARGIN
+        return max(Config.ADAPTIVE_MIN_TIMEOUT, min(default, timeout))
+
+    def poll_for(self, key, default=0.5):
+        """Poll at a fraction of the typical latency, clamped to [0.05, default]."""
+        found = [seconds for seconds, ok in self.samples.get(key, []) if ok]
+        if len(found) < Config.ADAPTIVE_MIN_SAMPLES:
+            return default
+        return max(0.05, min(default, percentile(found, 0.5) / 4))
+
+    def save(self):
+        """Merge this process's new samples into the file (safe across workers)."""
+        if not self._new:
+            return
+        directory = os.path.dirname(os.path.abspath(self.path))
+        with FileLock(os.path.join(directory, f"{os.path.basename(self.path)}.lock")):
+            on_disk = LatencyStats(self.path).load().samples
+            for key, history in self._new.items():
+                merged = on_disk.setdefault(key, [])
+                merged.extend(history)
+                del merged[: -Config.ADAPTIVE_MAX_SAMPLES]
+            write_json_atomic(self.path, on_disk, indent=1, sort_keys=True)
+        self._new = {}
+
+
+_stats = None
+
+
+def get_latency_stats():
+    """Process-wide statistics store, loaded on first use."""
+    global _stats
+    if _stats is None:
+        _stats = LatencyStats().load()
+    return _stats
@@ -0,0 +1,139 @@
+"""
+Network request tracking from Chrome DevTools Network events.
+Events are read from the chromedriver performance log, so no extra
+websocket connection is needed.
+"""
+
+import json
+import logging
+import re
+import time
+import weakref
+from selenium.common.exceptions import WebDriverException
+from utils.config import Config
+
+_monitors = weakref.WeakKeyDictionary()
+
+
+class NetworkMonitor:
+    def __init__(self, driver, ignore_patterns=None):
+        self.driver = driver
+        self.ignore = [re.compile(p) for p in (ignore_patterns or Config.NETWORK_IDLE_IGNORE)]
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+        self.requests = {}  # requestId -> request record, full log of the session
+        self.in_flight = {}  # requestId -> request record, only tracked requests
+        self.last_activity = time.time()
+
+    def poll(self):
+        """Drain pending DevTools events and update request state."""
+        try:
+            entries = self.driver.get_log("performance")
+        except WebDriverException as e:
+            self.logger.debug(f"Performance log unavailable: {e}")
+            return
+
+        for entry in entries:
+            message = json.loads(entry["message"])["message"]
+            method = message.get("method", "")
+            if method.startswith("Network."):
+                self._handle(method, message.get("params", {}))
+
+    def in_flight_by_frame(self):
+        """Number of tracked in-flight requests per frame id."""
+        frames = {}
+        for request in self.in_flight.values():
+            frames[request["frame"]] = frames.get(request["frame"], 0) + 1
+        return frames
+
+    def wait_for_idle(self, timeout=5, max_inflight=0, idle_time=0.5, poll_frequency=0.1):
+        """
+        Wait until at most 'max_inflight' tracked requests have been in flight
+        for 'idle_time' seconds. Returns True when idle, False on timeout.
+        """
+        deadline = time.time() + timeout
+        quiet_since = None
+        while time.time() < deadline:
+            self.poll()
+            now = time.time()
+            if len(self.in_flight) <= max_inflight:
+                quiet_since = quiet_since or now
+                if now - quiet_since >= idle_time:
+                    return True
+            else:
+                quiet_since = None
+            time.sleep(poll_frequency)
+        return False
+
+    def request_log(self):
+        """All requests seen so far, ordered by start time."""
+        return sorted(self.requests.values(), key=lambda r: r["start"])
+
+    def summary(self, request_ids):
+        """Bytes transferred and blocked count for the given requests."""
+        records = [self.requests[r] for r in request_ids if r in self.requests]
+        return {
+            "requests": len(records),
+            "bytes": sum(r["bytes"] for r in records),
+            "blocked": sum(1 for r in records if r["blocked"]),
+        }
+
+    def reset(self):
+        """Forget all state, e.g. between tests on a pooled session."""
+        self.poll()
+        self.requests.clear()
+        self.in_flight.clear()
+
+    def is_ignored(self, url, resource_type=None):
+        if resource_type in ("WebSocket", "EventSource"):
+            return True
+        return any(p.search(url) for p in self.ignore)
+
+    def _handle(self, method, params):
+        request_id = params.get("requestId")
+        self.last_activity = time.time()
+
+        if method == "Network.requestWillBeSent":
+            url = params["request"]["url"]
+            resource_type = params.get("type")
+            record = {
+                "id": request_id,
+                "url": url,
+                "method": params["request"].get("method"),
+                "type": resource_type,
+                "frame": params.get("frameId"),
+                "start": params.get("timestamp"),
+                "end": None,
+                "status": None,
+                "bytes": 0,
+                "failed": False,
+                "blocked": None,
+                "ignored": self.is_ignored(url, resource_type),
+            }
+            self.requests[request_id] = record
+            if not record["ignored"]:
+                self.in_flight[request_id] = record
+
+        elif method == "Network.responseReceived" and request_id in self.requests:
+            self.requests[request_id]["status"] = params["response"].get("status")
+
+        elif method in ("Network.loadingFinished", "Network.loadingFailed"):
+            record = self.requests.get(request_id)
+            if record is not None:
+                record["end"] = params.get("timestamp")
+                record["bytes"] = params.get("encodedDataLength", 0)
+                record["failed"] = method == "Network.loadingFailed"
+                record["blocked"] = params.get("blockedReason")
+            self.in_flight.pop(request_id, None)
+
+        elif method == "Network.webSocketCreated":
+            self.in_flight.pop(request_id, None)
+
+
+def get_network_monitor(driver):
+    """Network monitor bound to the given driver, created on first use."""
+    monitor = _monitors.get(driver)
+    if monitor is None:
+        monitor = NetworkMonitor(driver)
+        _monitors[driver] = monitor
+    return monitor
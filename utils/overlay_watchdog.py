@@ -0,0 +1,146 @@
+"""
+Background overlay watchdog.
+Registers an in-page MutationObserver on every document of the session
+(Page.addScriptToEvaluateOnNewDocument) that dismisses known overlays as soon
+as they appear, so explicit popup handlers don't have to block waiting.
+"""
+
+import datetime
+import json
+import logging
+import weakref
+from selenium.common.exceptions import WebDriverException
+from utils.Twitch_locators import TwitchLocators
+
+# name -> (blocker locator, dismiss locator); CSS selectors only
+KNOWN_OVERLAYS = {
+    "cookie_banner": (TwitchLocators.COOKIE_BANNER, TwitchLocators.COOKIE_ACCEPT),
+    "mature_warning": (TwitchLocators.MATURE_WARNING, TwitchLocators.MATURE_WARNING),
+}
+
+WATCHDOG_JS = """
+(function (overlays) {
+    if (window.__overlayWatchdog) return;
+    window.__overlayWatchdog = true;
+
+    const KEY = '__overlayDismissals';
+    function log(name) {
+        try {
+            const entries = JSON.parse(sessionStorage.getItem(KEY) || '[]');
+            entries.push({name: name, at: Date.now(), url: location.href});
+            sessionStorage.setItem(KEY, JSON.stringify(entries));
+        } catch (e) {}
+    }
+
+    function isVisible(el) {
+        const rect = el.getBoundingClientRect();
+        return rect.width > 0 && rect.height > 0;
+    }
+
+    let pending = false;
+    function scan() {
+        pending = false;
+        for (const overlay of overlays) {
+            if (!document.querySelector(overlay.blocker)) continue;
+            const button = document.querySelector(overlay.dismiss);
+            if (button && isVisible(button)) {
+                button.click();
+                log(overlay.name);
+            }
+        }
+    }
+
+    new MutationObserver(() => {
+        if (!pending) {
+            pending = true;
+            setTimeout(scan, 50);
+        }
+    }).observe(document, {childList: true, subtree: true});
+    scan();
+})(%s);
+"""
+
+_watchdogs = weakref.WeakKeyDictionary()
+
+
+class OverlayWatchdog:
+    def __init__(self, driver, overlays=None):
+        self.driver = driver
+        self.overlays = overlays or KNOWN_OVERLAYS
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def install(self):
+        """Register for every future document and arm the current one."""
+        table = [
+            {"name": name, "blocker": blocker[1], "dismiss": dismiss[1]}
+            for name, (blocker, dismiss) in self.overlays.items()
+        ]
+        source = WATCHDOG_JS % json.dumps(table)
+        self.driver.execute_cdp_cmd(
+            "Page.addScriptToEvaluateOnNewDocument", {"source": source}
+        )
+        self.driver.execute_script(source)
+        self.logger.info(f"✓ Overlay watchdog armed for: {', '.join(self.overlays)}")
+        return self
+
+    def is_present(self, locator):
+        """Single non-blocking check whether an overlay is currently shown."""
+        return self.driver.execute_script(
+            """
+            const el = document.querySelector(arguments[0]);
+            if (!el) return false;
+            const rect = el.getBoundingClientRect();
+            return rect.width > 0 && rect.height > 0;
+            """,
+            locator[1],
+        )
+
+    def dismissals(self):
+        """
+        Drain the dismissals recorded in this origin's session storage.
+        Each entry is returned once, so storage resets between pooled tests
+        and origin changes don't hide or repeat entries.
+        """
+        try:
+            return json.loads(
+                self.driver.execute_script(
+                    """
+                    const entries = sessionStorage.getItem('__overlayDismissals') || '[]';
+                    sessionStorage.removeItem('__overlayDismissals');
+                    return entries;
+                    """
+                )
+            )
+        except WebDriverException:
+            return []
+
+    def dismissed(self, locator, entries):
+        """True if 'entries' include a dismissal of the overlay blocked by 'locator'."""
+        return any(
+            self.overlays.get(entry["name"], (None, None))[0] == locator
+            for entry in entries
+        )
+
+    def log_dismissals(self):
+        """Log and return dismissals recorded since the last call."""
+        entries = self.dismissals()
+        for entry in entries:
+            at = datetime.datetime.fromtimestamp(entry["at"] / 1000)
+            self.logger.info(
+                f"✓ Overlay '{entry['name']}' auto-dismissed at {at:%H:%M:%S.%f} ({entry['url']})"
+            )
+        return entries
+
+
+def install_overlay_watchdog(driver):
+    """Install the watchdog once per session."""
+    watchdog = _watchdogs.get(driver)
+    if watchdog is None:
+        watchdog = OverlayWatchdog(driver).install()
+        _watchdogs[driver] = watchdog
+    return watchdog
+
+
+def get_overlay_watchdog(driver):
+    """The session's watchdog, or None when it was not installed."""
+    return _watchdogs.get(driver)
@@ -0,0 +1,206 @@
+"""
+Parallel sharded test runner.
+
+Shards test cases x device profiles across N worker processes, each with its
+own browser, balances shards using recorded durations and merges the JUnit
+results into a single report.
+
+Usage:
+    python -m utils.parallel_runner -n 4 [pytest args...]
+"""
+
+import argparse
+import heapq
+import json
+import os
+import subprocess
+import sys
+import time
+import xml.etree.ElementTree as ET
+from utils.config import Config
+
+DEFAULT_DURATION = 60.0
+
+
+def collect_tests(pytest_args):
+    """Node ids collected by pytest for the given arguments."""
+    output = subprocess.run(
+        [sys.executable, "-m", "pytest", "--collect-only", "-q", "-p", "no:logging"]
+        + pytest_args,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return [line.strip() for line in output.splitlines() if "::" in line]
+
+
+def load_durations():
+    try:
+        with open(Config.DURATIONS_FILE, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_durations(durations):
+    with open(Config.DURATIONS_FILE, "w", encoding="utf-8") as f:
+        json.dump(durations, f, indent=2, sort_keys=True)
+
+
+def shard(items, workers, durations):
+    """
+    Longest-processing-time-first balancing of (nodeid, device) items.
+    Unknown items get the average recorded duration.
+    """
+    known = [durations[key] for key in map(duration_key, items) if key in durations]
+    fallback = sum(known) / len(known) if known else DEFAULT_DURATION
+
+    weighted = sorted(
+        items, key=lambda item: durations.get(duration_key(item), fallback), reverse=True
+    )
+    heap = [(0.0, index) for index in range(workers)]
+    shards = [[] for _ in range(workers)]
+    for item in weighted:
+        load, index = heapq.heappop(heap)
+        shards[index].append(item)
+        heapq.heappush(heap, (load + durations.get(duration_key(item), fallback), index))
+    return [s for s in shards if s]
+
+
+def duration_key(item):
+    nodeid, device = item
+    return f"{device}::{nodeid}"
+
+
+def is_test_selector(arg):
+    """True for path / node id arguments, as opposed to pytest options."""
+    if arg.startswith("-"):
+        return False
+    return "::" in arg or os.path.exists(arg)
+
+
+def worker_options(pytest_args):
+    """
+    Pytest options to forward to workers. Paths and node ids are dropped:
+    each worker gets its own node ids, and pytest would otherwise run the
+    whole file on every worker.
+    """
+    return [arg for arg in pytest_args if not is_test_selector(arg)]
+
+
+def worker_commands(index, items, pytest_args):
+    """(device, report, command) per device for one worker's items."""
+    options = worker_options(pytest_args)
+    by_device = {}
+    for nodeid, device in items:
+        by_device.setdefault(device, []).append(nodeid)
+
+    commands = []
+    for device_index, (device, nodeids) in enumerate(by_device.items()):
+        report = os.path.join(
+            Config.ARTIFACTS_DIR, f"gw{index}", f"junit-{device_index}.xml"
+        )
+        os.makedirs(os.path.dirname(report), exist_ok=True)
+        commands.append(
+            (
+                device,
+                report,
+                [sys.executable, "-m", "pytest", f"--junitxml={report}"]
+                + options
+                + nodeids,
+            )
+        )
+    return commands
+
+
+def start_worker(index, items, pytest_args):
+    """Start one worker; runs its items grouped per device, sequentially."""
+    commands = worker_commands(index, items, pytest_args)
+    env = dict(os.environ)
+    env[Config.WORKER_ID_ENV] = f"gw{index}"
+    script = (
+        "import json, os, subprocess, sys\n"
+        "rc = 0\n"
+        "for device, report, cmd in json.loads(sys.argv[1]):\n"
+        f"    env = dict(os.environ, {Config.DEVICE_ENV}=device)\n"
+        "    rc = subprocess.call(cmd, env=env) or rc\n"
+        "sys.exit(rc)\n"
+    )
+    process = subprocess.Popen([sys.executable, "-c", script, json.dumps(commands)], env=env)
+    return process, [(device, report) for device, report, _ in commands]
+
+
+def merge_reports(reports, output):
+    """Merge worker JUnit reports into one; returns per-item durations."""
+    merged = ET.Element("testsuites")
+    suite = ET.SubElement(merged, "testsuite", name="parallel")
+    durations = {}
+    totals = {"tests": 0, "failures": 0, "errors": 0, "skipped": 0}
+
+    for device, report in reports:
+        try:
+            root = ET.parse(report).getroot()
+        except (OSError, ET.ParseError):
+            continue
+        for case in root.iter("testcase"):
+            case.set("name", f"{case.get('name')}[{device}]")
+            suite.append(case)
+            totals["tests"] += 1
+            for outcome, key in (
+                ("failure", "failures"),
+                ("error", "errors"),
+                ("skipped", "skipped"),
+            ):
+                if case.find(outcome) is not None:
+                    totals[key] += 1
+
+            classname = case.get("classname", "").replace(".", "/")
+            nodeid = f"{classname}.py::{case.get('name').rsplit('[', 1)[0]}"
+            durations[duration_key((nodeid, device))] = float(case.get("time", 0))
+
+    for key, value in totals.items():
+        suite.set(key, str(value))
+    ET.ElementTree(merged).write(output, encoding="utf-8", xml_declaration=True)
+    return durations, totals
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the suite in parallel shards")
+    parser.add_argument("-n", "--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument(
+        "--devices", nargs="+", default=Config.DEVICE_PROFILES, help="Device profiles"
+    )
+    parser.add_argument("--report", default=os.path.join(Config.ARTIFACTS_DIR, "junit.xml"))
+    args, pytest_args = parser.parse_known_args(argv)
+
+    nodeids = collect_tests(pytest_args)
+    items = [(nodeid, device) for nodeid in nodeids for device in args.devices]
+    if not items:
+        print("No tests collected")
+        return 1
+
+    durations = load_durations()
+    shards = shard(items, args.workers, durations)
+
+    start_time = time.time()
+    # One run id shared by all workers for the metrics files
+    os.environ.setdefault(Config.RUN_ID_ENV, time.strftime("%Y%m%d-%H%M%S"))
+    workers = [start_worker(index, items, pytest_args) for index, items in enumerate(shards)]
+    return_code = 0
+    reports = []
+    for process, worker_reports in workers:
+        return_code = process.wait() or return_code
+        reports.extend(worker_reports)
+
+    measured, totals = merge_reports(reports, args.report)
+    durations.update(measured)
+    save_durations(durations)
+
+    print(
+        f"{totals['tests']} tests on {len(shards)} workers in {time.time() - start_time:.1f}s "
+        f"({totals['failures']} failed, {totals['errors']} errors) -> {args.report}"
+    )
+    return return_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
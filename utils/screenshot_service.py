@@ -0,0 +1,182 @@
+"""
+Asynchronous screenshot pipeline.
+Captures through CDP Page.captureScreenshot and decodes, hashes and stores
+frames in the content-addressed artifact store on a background thread pool
+so the test flow is not blocked by disk I/O. The thumbnail used for
+near-duplicate detection is only taken over the direct DevTools transport,
+where it is pipelined with the frame; over WebDriver each capture is a single
+round trip and only exact duplicates are shared.
+"""
+
+import base64
+import logging
+import os
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from selenium.common.exceptions import WebDriverException
+from utils.artifact_store import ArtifactStore, dhash, mean_brightness
+from utils.artifacts import current_test, run_id
+from utils.cdp_transport import get_cdp_session
+from utils.config import Config
+
+_services = weakref.WeakKeyDictionary()
+
+
+class ScreenshotService:
+    def __init__(
+        self,
+        driver,
+        image_format=None,
+        quality=None,
+        max_workers=None,
+        queue_size=None,
+        store=None,
+    ):
+        self.driver = driver
+        self.store = store or ArtifactStore()
+        self._viewport = None
+        self.image_format = image_format or Config.SCREENSHOT_FORMAT
+        self.quality = quality or Config.SCREENSHOT_QUALITY
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers or Config.SCREENSHOT_WORKERS,
+            thread_name_prefix="screenshot",
+        )
+        self._slots = threading.BoundedSemaphore(queue_size or Config.SCREENSHOT_QUEUE_SIZE)
+        self._pending = set()
+        self._lock = threading.Lock()
+
+    def capture(self, step, clip=None):
+        """
+        Grab the frame now and queue hashing/storing under 'step'
+        (e.g. Config.SCREENSHOT_HOME) for the current test.
+        clip: optional dict with x, y, width, height (CSS pixels).
+        Returns a future resolving to the artifact manifest entry.
+        """
+        data, thumbnail, extension = self._grab(clip)
+        test = current_test()
+
+        # Blocks the caller only when the queue is full (backpressure)
+        self._slots.acquire()
+        try:
+            future = self._executor.submit(
+                self._store, step, test, data, thumbnail, extension
+            )
+        except Exception:
+            self._slots.release()
+            raise
+        with self._lock:
+            self._pending.add(future)
+        future.add_done_callback(self._done)
+        return future
+
+    def flush(self):
+        """Wait until every queued screenshot has been written."""
+        with self._lock:
+            pending = list(self._pending)
+        for future in pending:
+            try:
+                future.result()
+            except Exception as e:
+                self.logger.warning(f"Screenshot write failed: {e}")
+
+    def shutdown(self):
+        self.flush()
+        self._executor.shutdown(wait=True)
+
+    def _grab(self, clip):
+        """
+        Base64 frame, a tiny PNG thumbnail for perceptual hashing (None over
+        WebDriver) and the frame's file extension.
+        """
+        params = {"format": self.image_format}
+        if self.image_format != "png":
+            params["quality"] = self.quality
+        if clip:
+            params["clip"] = dict(clip, scale=clip.get("scale", 1))
+        try:
+            cdp = get_cdp_session(self.driver)
+            if cdp is not None:
+                frame, thumbnail = cdp.call_many(
+                    [
+                        ("Page.captureScreenshot", params),
+                        ("Page.captureScreenshot", self._thumbnail_params(cdp, clip)),
+                    ]
+                )
+                return frame["data"], thumbnail["data"], self._extension()
+            frame = self.driver.execute_cdp_cmd("Page.captureScreenshot", params)
+            return frame["data"], None, self._extension()
+        except (AttributeError, WebDriverException):
+            # Non-Chromium driver or transient CDP failure: plain WebDriver PNG
+            # for this capture only, exact dedupe only
+            return self.driver.get_screenshot_as_base64(), None, "png"
+
+    def _thumbnail_params(self, cdp, clip):
+        """Capture the frame area scaled down to ~9px wide."""
+        if clip is None:
+            if self._viewport is None:
+                metrics = cdp.call("Page.getLayoutMetrics")
+                viewport = metrics["cssLayoutViewport"]
+                self._viewport = {
+                    "x": 0,
+                    "y": 0,
+                    "width": viewport["clientWidth"],
+                    "height": viewport["clientHeight"],
+                }
+            clip = self._viewport
+        area = {k: clip[k] for k in ("x", "y", "width", "height")}
+        return {"format": "png", "clip": dict(area, scale=9 / area["width"])}
+
+    def _store(self, step, test, data, thumbnail, extension):
+        phash = luma = None
+        if thumbnail is not None:
+            try:
+                thumbnail = base64.b64decode(thumbnail)
+                phash, luma = dhash(thumbnail), mean_brightness(thumbnail)
+            except (ValueError, IndexError, ZeroDivisionError) as e:
+                self.logger.debug(f"Perceptual hash skipped: {e}")
+        entry = self.store.put(
+            base64.b64decode(data),
+            extension,
+            phash=phash,
+            luma=luma,
+            test=test,
+            step=os.path.splitext(step)[0],
+            run=run_id(),
+        )
+        if entry["duplicate"]:
+            self.logger.debug(f"{step}: {entry['duplicate']} duplicate of {entry['blob'][:12]}")
+        return entry
+
+    def _done(self, future):
+        with self._lock:
+            self._pending.discard(future)
+        self._slots.release()
+
+    def _extension(self):
+        return "jpg" if self.image_format == "jpeg" else self.image_format
+
+
+def get_screenshot_service(driver):
+    """Screenshot service bound to the given driver, created on first use."""
+    service = _services.get(driver)
+    if service is None:
+        service = ScreenshotService(driver)
+        _services[driver] = service
+    return service
+
+
+def flush_screenshots(driver):
+    """Flush pending writes for the driver, if it has a service."""
+    service = _services.get(driver)
+    if service is not None:
+        service.flush()
+
+
+def shutdown_screenshots(driver):
+    """Flush and stop the driver's service before the driver quits."""
+    service = _services.pop(driver, None)
+    if service is not None:
+        service.shutdown()
@@ -0,0 +1,126 @@
+"""
+Pre-seeded browser state snapshots.
+Captures cookies and localStorage after consent/onboarding and injects them
+into later sessions so they skip the consent banner. Snapshots carry a
+version, device and age; an invalid snapshot is ignored and the normal
+popup handling runs instead.
+"""
+
+import json
+import logging
+import os
+import time
+from urllib.parse import urljoin, urlparse
+from utils.config import Config
+from utils.file_io import write_json_atomic
+
+logger = logging.getLogger(__name__)
+
+
+def snapshot_path(device=None):
+    device = (device or Config.MOBILE_DEVICE).replace(" ", "_")
+    return os.path.join(Config.STATE_SNAPSHOT_DIR, f"state_{device}.json")
+
+
+def origin_of(url):
+    parsed = urlparse(url)
+    return f"{parsed.scheme}://{parsed.netloc}"
+
+
+def capture_snapshot(driver, path=None):
+    """Save the current cookies and localStorage of the page's origin."""
+    snapshot = {
+        "version": Config.STATE_SNAPSHOT_VERSION,
+        "device": Config.MOBILE_DEVICE,
+        "created": time.time(),
+        "origin": origin_of(driver.current_url),
+        "cookies": driver.get_cookies(),
+        "local_storage": driver.execute_script(
+            "return Object.assign({}, window.localStorage);"
+        ),
+    }
+    path = path or snapshot_path()
+    write_json_atomic(path, snapshot)
+    logger.info(f"✓ Browser state snapshot saved: {path}")
+    return snapshot
+
+
+def load_snapshot(path=None):
+    """The stored snapshot if it is still valid, else None."""
+    path = path or snapshot_path()
+    try:
+        with open(path, encoding="utf-8") as f:
+            snapshot = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    reason = None
+    if snapshot.get("version") != Config.STATE_SNAPSHOT_VERSION:
+        reason = "version mismatch"
+    elif snapshot.get("device") != Config.MOBILE_DEVICE:
+        reason = "device mismatch"
+    elif time.time() - snapshot.get("created", 0) > Config.STATE_SNAPSHOT_MAX_AGE:
+        reason = "expired"
+    elif any(c.get("expiry", float("inf")) < time.time() for c in snapshot["cookies"]):
+        reason = "cookie expired"
+
+    if reason:
+        logger.info(f"State snapshot ignored ({reason}), using normal popup handling")
+        return None
+    return snapshot
+
+
+def cdp_cookie(cookie):
+    """Network.setCookies parameters for a WebDriver cookie, keeping every attribute."""
+    params = {
+        "name": cookie["name"],
+        "value": cookie["value"],
+        "domain": cookie.get("domain"),
+        "path": cookie.get("path", "/"),
+        "secure": cookie.get("secure", False),
+        "httpOnly": cookie.get("httpOnly", False),
+    }
+    if "expiry" in cookie:
+        params["expires"] = cookie["expiry"]
+    if cookie.get("sameSite"):
+        params["sameSite"] = cookie["sameSite"]
+    return params
+
+
+def seed_storage(driver, origin, local_storage, session_storage=None):
+    """
+    Replace localStorage/sessionStorage of 'origin' from a lightweight page of
+    that origin, before the app itself boots. The browser is left on that page.
+    """
+    driver.get(urljoin(origin, Config.STATE_SNAPSHOT_SEED_PATH))
+    driver.execute_script(
+        """
+        const [local, session] = arguments;
+        window.localStorage.clear();
+        window.sessionStorage.clear();
+        for (const key of Object.keys(local)) {
+            window.localStorage.setItem(key, local[key]);
+        }
+        for (const key of Object.keys(session)) {
+            window.sessionStorage.setItem(key, session[key]);
+        }
+        """,
+        local_storage,
+        session_storage or {},
+    )
+
+
+def restore_snapshot(driver, snapshot):
+    """
+    Inject cookies through CDP and localStorage on the snapshot origin.
+    The browser is left on a lightweight page of that origin.
+    """
+    cookies = [cdp_cookie(cookie) for cookie in snapshot["cookies"]]
+    driver.execute_cdp_cmd("Network.setCookies", {"cookies": cookies})
+
+    if snapshot["local_storage"]:
+        seed_storage(driver, snapshot["origin"], snapshot["local_storage"])
+    logger.info(
+        f"✓ Restored state snapshot: {len(cookies)} cookies, "
+        f"{len(snapshot['local_storage'])} localStorage keys"
+    )
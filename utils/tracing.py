@@ -0,0 +1,202 @@
+"""
+Step-level timing spans.
+Records nested spans for page-object actions and exports them per test in
+Chrome trace-event format and as JSONL. Category totals use self time (span
+duration minus child spans and WebDriver round trips), so nested spans are
+not counted twice.
+"""
+
+import functools
+import inspect
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+# Script helpers do the work of whichever step called them
+PLUMBING = ("run_script", "run_async_script")
+
+
+def span_category(name):
+    """Bucket a span by the kind of work its method does."""
+    method = name.rsplit(".", 1)[-1]
+    if method.startswith("wait_for") or method.startswith("wait_"):
+        return "wait"
+    if method.startswith("assert_"):
+        return "assertion"
+    if method in ("open_url", "navigate_to_twitch"):
+        return "navigation"
+    if "popup" in method:
+        return "popup"
+    return "action"
+
+
+class Tracer:
+    def __init__(self):
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self.test = None
+        self.spans = []
+        self.run_totals = {}
+        self.self_totals = {}
+
+    def start_test(self, nodeid):
+        with self._lock:
+            self.test = nodeid
+            self.spans = []
+
+    @contextmanager
+    def span(self, name, category=None, **args):
+        stack = self._stack()
+        parent = stack[-1] if stack else None
+        if category is None:
+            plumbing = parent and name.rsplit(".", 1)[-1] in PLUMBING
+            category = parent["cat"] if plumbing else span_category(name)
+        record = {
+            "name": name,
+            "cat": category,
+            "start": time.perf_counter(),
+            "depth": len(stack),
+            "parent": parent["name"] if parent else None,
+            "thread": threading.get_ident(),
+            "args": args,
+            "error": None,
+            "children": 0.0,
+            "webdriver": 0.0,
+        }
+        stack.append(record)
+        try:
+            yield record
+        except Exception as e:
+            record["error"] = type(e).__name__
+            raise
+        finally:
+            stack.pop()
+            record["duration"] = time.perf_counter() - record["start"]
+            record["self"] = max(
+                0.0, record["duration"] - record["children"] - record["webdriver"]
+            )
+            if parent is not None:
+                parent["children"] += record["duration"]
+            with self._lock:
+                self.spans.append(record)
+                cat = record["cat"]
+                self.self_totals[cat] = self.self_totals.get(cat, 0.0) + record["self"]
+                total = self.run_totals.setdefault(name, [0, 0.0, 0.0, record["cat"]])
+                total[0] += 1
+                total[1] += record["duration"]
+                total[2] = max(total[2], record["duration"])
+
+    def record_command(self, elapsed, blocking=False):
+        """
+        Attribute a WebDriver round trip to the innermost open span as
+        'webdriver' overhead. Blocking commands (async scripts waiting
+        in-page) stay part of the calling step's own time.
+        """
+        stack = self._stack()
+        if blocking or not stack:
+            return
+        stack[-1]["webdriver"] += elapsed
+        with self._lock:
+            self.self_totals["webdriver"] = self.self_totals.get("webdriver", 0.0) + elapsed
+
+    def current_stack(self):
+        """Open spans of the calling thread, outermost first."""
+        return list(self._stack())
+
+    def export(self, directory):
+        """Write trace.json (Chrome trace events) and spans.jsonl for the current test."""
+        with self._lock:
+            spans = sorted(self.spans, key=lambda s: s["start"])
+        if not spans:
+            return
+        os.makedirs(directory, exist_ok=True)
+        origin = spans[0]["start"]
+
+        events = [
+            {
+                "name": s["name"],
+                "cat": s["cat"],
+                "ph": "X",
+                "ts": (s["start"] - origin) * 1e6,
+                "dur": s["duration"] * 1e6,
+                "pid": os.getpid(),
+                "tid": s["thread"],
+                "args": dict(s["args"], error=s["error"]) if s["error"] else s["args"],
+            }
+            for s in spans
+        ]
+        with open(os.path.join(directory, "trace.json"), "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": events, "metadata": {"test": self.test}}, f)
+
+        with open(os.path.join(directory, "spans.jsonl"), "w", encoding="utf-8") as f:
+            for s in spans:
+                f.write(
+                    json.dumps(
+                        {
+                            "test": self.test,
+                            "name": s["name"],
+                            "category": s["cat"],
+                            "parent": s["parent"],
+                            "depth": s["depth"],
+                            "offset_s": round(s["start"] - origin, 6),
+                            "duration_s": round(s["duration"], 6),
+                            "self_s": round(s["self"], 6),
+                            "webdriver_s": round(s["webdriver"], 6),
+                            "error": s["error"],
+                            "commands": s.get("commands", 0),
+                            "args": s["args"],
+                        },
+                        default=str,
+                    )
+                    + "\n"
+                )
+
+    def slowest(self, limit=10):
+        """(name, category, count, total_s, max_s) sorted by total time."""
+        with self._lock:
+            rows = [
+                (name, cat, count, total, worst)
+                for name, (count, total, worst, cat) in self.run_totals.items()
+            ]
+        return sorted(rows, key=lambda row: row[3], reverse=True)[:limit]
+
+    def category_totals(self):
+        """{category: self time in seconds}, including 'webdriver' overhead."""
+        with self._lock:
+            return dict(self.self_totals)
+
+    def _stack(self):
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+        return self._local.stack
+
+
+tracer = Tracer()
+
+
+def traced(func):
+    """Record a span around a page-object method."""
+    if getattr(func, "__traced__", False):
+        return func
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with tracer.span(func.__qualname__):
+            return func(*args, **kwargs)
+
+    wrapper.__traced__ = True
+    return wrapper
+
+
+def traced_class(cls):
+    """Wrap every public method defined on the class with a span."""
+    for name, member in list(vars(cls).items()):
+        if name.startswith("_") or not inspect.isfunction(member):
+            continue
+        if inspect.isgeneratorfunction(inspect.unwrap(member)):
+            # Context managers (e.g. screenshot_step) time their body at call site
+            continue
+        setattr(cls, name, traced(member))
+    return cls
@@ -0,0 +1,228 @@
+"""
+Core Web Vitals and navigation-timing collection.
+
+A collector registered on every document records TTFB, FCP, LCP, CLS,
+INP-style interaction latency, long tasks and resource timing per
+navigation, including client-side route changes (history.pushState /
+replaceState / popstate). Results are appended to a per-run JSONL file
+tagged with the device profile.
+
+Compare runs:
+    python -m utils.web_vitals [--metric lcp] [--last 10]
+"""
+
+import argparse
+import json
+import os
+import sys
+import weakref
+from urllib.parse import urlparse
+from selenium.common.exceptions import WebDriverException
+from utils.artifacts import current_test, run_id, worker_id
+from utils.config import Config
+
+COLLECTOR_JS = """
+(function () {
+    if (window.__vitals) return;
+    let segments = [];
+    let current = null;
+    let hard = null;
+    let navStart = 0;
+    let firstFrame = null;
+
+    function newSegment(kind) {
+        current = {
+            kind: kind, url: location.href, start: performance.now(),
+            ttfb: null, fcp: null, lcp: null, cls: 0, inp: null,
+            long_tasks: 0, long_task_ms: 0,
+        };
+        segments.push(current);
+        return current;
+    }
+    hard = newSegment('hard');
+
+    function segmentAt(time) {
+        for (let i = segments.length - 1; i >= 0; i--) {
+            if (segments[i].start <= time) return segments[i];
+        }
+        return current;
+    }
+
+    function observe(type, callback, options) {
+        try {
+            new PerformanceObserver(list => list.getEntries().forEach(callback))
+                .observe(Object.assign({type: type, buffered: true}, options || {}));
+        } catch (e) {}
+    }
+    observe('paint', e => { if (e.name === 'first-contentful-paint') hard.fcp = e.startTime; });
+    observe('largest-contentful-paint', e => { hard.lcp = e.startTime; });
+    observe('layout-shift', e => { if (!e.hadRecentInput) segmentAt(e.startTime).cls += e.value; });
+    observe('event', e => {
+        if (!e.interactionId) return;
+        const s = segmentAt(e.startTime);
+        s.inp = Math.max(s.inp || 0, e.duration);
+    }, {durationThreshold: 16});
+    observe('longtask', e => {
+        const s = segmentAt(e.startTime);
+        s.long_tasks++;
+        s.long_task_ms += e.duration;
+    });
+
+    // Time to first video frame from the start of the current navigation;
+    // media events don't bubble, so listen in the capture phase
+    document.addEventListener('playing', e => {
+        if (firstFrame === null && e.target instanceof HTMLVideoElement) {
+            firstFrame = performance.now() - navStart;
+        }
+    }, true);
+
+    function onRoute() {
+        if (location.href !== current.url) {
+            navStart = newSegment('soft').start;
+            firstFrame = null;
+        }
+    }
+    for (const name of ['pushState', 'replaceState']) {
+        const original = history[name];
+        history[name] = function () {
+            const result = original.apply(this, arguments);
+            onRoute();
+            return result;
+        };
+    }
+    window.addEventListener('popstate', onRoute);
+
+    window.__vitals = {
+        firstFrame: function () {
+            return firstFrame;
+        },
+        drain: function () {
+            const nav = performance.getEntriesByType('navigation')[0];
+            if (nav) hard.ttfb = nav.responseStart;
+            const resources = performance.getEntriesByType('resource');
+            const out = segments.map((s, i) => {
+                const end = i + 1 < segments.length ? segments[i + 1].start : Infinity;
+                const own = resources.filter(r => r.startTime >= s.start && r.startTime < end);
+                return Object.assign({}, s, {
+                    resources: own.length,
+                    transfer_bytes: own.reduce((sum, r) => sum + (r.transferSize || 0), 0),
+                });
+            });
+            segments = [];
+            newSegment('continued');
+            return out;
+        },
+    };
+})();
+"""
+
+METRICS = ["ttfb", "fcp", "lcp", "cls", "inp", "long_task_ms", "transfer_bytes"]
+
+_installed = weakref.WeakSet()
+
+
+def install_vitals_collector(driver):
+    """Register the collector for every future document of the session (once)."""
+    if driver in _installed:
+        return
+    driver.execute_cdp_cmd(
+        "Page.addScriptToEvaluateOnNewDocument", {"source": COLLECTOR_JS}
+    )
+    driver.execute_script(COLLECTOR_JS)
+    _installed.add(driver)
+
+
+def flush_vitals(driver, test=None):
+    """Drain the current document's segments into the per-run metrics file."""
+    if driver not in _installed:
+        return []
+    try:
+        segments = driver.execute_script(
+            "return window.__vitals ? window.__vitals.drain() : [];"
+        )
+    except WebDriverException:
+        return []
+
+    segments = [s for s in segments if is_measured(s)]
+    if not segments:
+        return []
+
+    os.makedirs(Config.ARTIFACTS_DIR, exist_ok=True)
+    with open(Config.VITALS_FILE, "a", encoding="utf-8") as f:
+        for segment in segments:
+            record = dict(
+                segment,
+                run=run_id(),
+                device=Config.MOBILE_DEVICE,
+                worker=worker_id(),
+                test=test or current_test(),
+                path=urlparse(segment["url"]).path,
+            )
+            f.write(json.dumps(record) + "\n")
+    return segments
+
+
+def is_measured(segment):
+    """Whether a segment belongs to a real page rather than a blank or seed page."""
+    url = urlparse(segment["url"])
+    if url.scheme not in ("http", "https"):
+        return False
+    if url.path == Config.STATE_SNAPSHOT_SEED_PATH:
+        return False
+    return (
+        segment["kind"] != "continued"
+        or segment["long_tasks"]
+        or segment["cls"]
+        or segment["inp"]
+    )
+
+
+def load_records(path=None):
+    records = []
+    with open(path or Config.VITALS_FILE, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                records.append(json.loads(line))
+    return records
+
+
+def p75(values):
+    values = sorted(v for v in values if v is not None)
+    if not values:
+        return None
+    return values[min(len(values) - 1, int(0.75 * len(values)))]
+
+
+def compare(records, metric, last):
+    """p75 of a metric per (device, path) for the most recent runs."""
+    runs = sorted({r["run"] for r in records})[-last:]
+    table = {}
+    for record in records:
+        if record["run"] in runs:
+            key = (record["device"], record["kind"], record["path"])
+            table.setdefault(key, {}).setdefault(record["run"], []).append(record.get(metric))
+    return runs, {key: {run: p75(v) for run, v in by_run.items()} for key, by_run in table.items()}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare web vitals across runs")
+    parser.add_argument("--file", default=Config.VITALS_FILE)
+    parser.add_argument("--metric", choices=METRICS, default="lcp")
+    parser.add_argument("--last", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    runs, table = compare(load_records(args.file), args.metric, args.last)
+    print(f"p75 {args.metric} per run: " + " | ".join(runs))
+    for (device, kind, path), by_run in sorted(table.items()):
+        values = [by_run.get(run) for run in runs]
+        cells = ["-" if v is None else f"{v:.3f}" if args.metric == "cls" else f"{v:.0f}" for v in values]
+        known = [v for v in values if v is not None]
+        trend = ""
+        if len(known) >= 2 and known[0]:
+            trend = f"  ({(known[-1] - known[0]) / known[0] * 100:+.0f}%)"
+        print(f"{device:<20} {kind:<5} {path:<40} {' | '.join(cells)}{trend}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())